@@ -1,15 +1,15 @@
 from supabase import create_client
 
 from utils.add_sgx_filings_helper import generate_title_and_body
+from utils.news_api import get_news_api
 
 import streamlit as st 
 import json
 import time
-import requests
 import traceback
 
 
-API_KEY = st.secrets["API_KEY"]
+NEWS_API = get_news_api(st.secrets["API_KEY"])
 SUPABASE_URL = st.secrets["SUPABASE_URL"]
 SUPABASE_KEY = st.secrets["SUPABASE_KEY"]
 
@@ -208,14 +208,7 @@ def main_ui():
                 content = uploaded_file.read()
                 data = json.loads(content)
                 
-                headers = {"Authorization": f"Bearer {API_KEY}"}
-
-                response = requests.post(
-                    "https://sectors-news-endpoint.fly.dev/sgx-insider-trading",
-                    headers=headers,
-                    json=data,
-                    timeout=60
-                )
+                response = NEWS_API.post_sgx_insider_trading(data)
 
                 if not response.ok:
                     try:
@@ -0,0 +1,123 @@
+"""
+Single pass header extraction against the previous per-field regex searches.
+
+The reference functions below are the implementations scan_header_fields
+replaced, with their patterns compiled on every call as before. Both paths
+must agree on every sample before any timing is reported.
+
+Usage (from the repository root):
+    python -m benchmarks.header_extraction
+"""
+from insider_idx_helper.parser_idx_helper import (
+    extract_holder_name,
+    extract_shares,
+    extract_symbol_and_company_name,
+    scan_header_fields
+)
+from insider_idx_helper.utils.helper import clean_number, clean_percentage
+from benchmarks.synthetic_idx import cover_lines, table_text
+
+import argparse
+import logging
+import re
+import sys
+import time
+
+
+def reference_holder_name(text: str) -> str:
+    holder_name = re.search(r"Nama \(sesuai SID\)\s*:\s*(.+?)(?:\n|$)", text, re.IGNORECASE)
+    holder_name = holder_name.group(1) if holder_name else None
+
+    if holder_name:
+        holder_name = re.sub(r'\bPt\b', 'PT', holder_name.title())
+
+    return holder_name
+
+
+def reference_symbol_and_company_name(text: str) -> tuple[str | None, str | None]:
+    pattern = r"Nama Perusahaan Tbk\s*:\s*([A-Z]+)\s*-\s*(.+?)(?=Tbk|PT|Jumlah Saham)"
+    match = re.search(pattern, text, re.DOTALL)
+
+    if not match:
+        return None, None
+
+    company_name = re.sub(r'\s+', ' ', match.group(2).strip()).rstrip(',').strip()
+
+    if 'Tbk' in text[match.end():match.end()+20]:
+        company_name += ' Tbk'
+
+    return f'{match.group(1).strip()}.JK', company_name
+
+
+def reference_shares(text: str) -> dict:
+    shares_before = re.search(r"Jumlah Saham Sebelum Transaksi\s*:\s*([\d\.,]+)", text, re.IGNORECASE)
+    shares_after = re.search(r"Jumlah Saham Setelah Transaksi\s*:\s*([\d\.,]+)", text, re.IGNORECASE)
+    vote_before = re.search(r"Hak Suara Sebelum Transaksi\s*:\s*([\d,]+)\s*%?", text, re.IGNORECASE)
+    vote_after = re.search(r"Hak Suara Setelah Transaksi\s*:\s*([\d,]+)\s*%?", text, re.IGNORECASE)
+
+    return {
+        "holding_before": clean_number(shares_before.group(1)) if shares_before else None,
+        "holding_after": clean_number(shares_after.group(1)) if shares_after else None,
+        "share_percentage_before": clean_percentage(vote_before.group(1)) if vote_before else None,
+        "share_percentage_after": clean_percentage(vote_after.group(1)) if vote_after else None
+    }
+
+
+def reference_header(text: str) -> tuple:
+    return reference_holder_name(text), reference_symbol_and_company_name(text), reference_shares(text)
+
+
+def single_pass_header(text: str) -> tuple:
+    # Cleared so every call pays for its scan, as a new document would
+    scan_header_fields.cache_clear()
+    return extract_holder_name(text), extract_symbol_and_company_name(text), extract_shares(text)
+
+
+def samples(table_rows: int) -> dict[str, str]:
+    cover = "\n".join(cover_lines())
+
+    return {
+        'cover': cover,
+        # Company name running into the holder label, the lazy span crosses it
+        'unterminated_company': cover.replace("\nTbk", "").replace("Bank Central Asia", "Bank Central Asia\nNama (sesuai SID) : x"),
+        'cover_and_table': cover + "\n" + table_text(table_rows),
+        'table_only': table_text(table_rows)
+    }
+
+
+def best_of(function, text: str, rounds: int) -> float:
+    best = float('inf')
+
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function(text)
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=40, help='transaction rows after the cover')
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{'sample':<22} {'chars':>7} {'reference us':>13} {'single pass us':>15} {'speedup':>8}")
+
+    for name, text in samples(args.rows).items():
+        if reference_header(text) != single_pass_header(text):
+            print(f"FAIL: {name} differs from the reference extraction")
+            return 1
+
+        reference = best_of(reference_header, text, args.rounds)
+        single_pass = best_of(single_pass_header, text, args.rounds)
+
+        print(f"{name:<22} {len(text):>7} {reference * 1e6:>13.2f} {single_pass * 1e6:>15.2f} {reference / single_pass:>7.2f}x")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Column normalization of IDX number formats against the per value helpers.
+
+clean_number / clean_percentage are called once per value, the way the
+parser does, and compared with normalize_numbers / normalize_percentages on
+the same column. Every value must agree before any timing is reported.
+
+Usage (from the repository root):
+    python -m benchmarks.number_normalization --values 500000
+"""
+from insider_idx_helper.utils.helper import clean_number, clean_percentage
+from insider_idx_helper.utils.number_format import normalize_numbers, normalize_percentages
+
+import argparse
+import logging
+import math
+import random
+import sys
+import time
+
+
+def random_number(rng: random.Random) -> str | None:
+    roll = rng.random()
+
+    if roll < 0.05:
+        return None
+
+    if roll < 0.07:
+        return rng.choice(['-', 'n/a', '1.2x'])
+
+    number = f'{rng.randint(0, 10 ** 10):,}'.replace(',', '.')
+
+    if rng.random() < 0.3:
+        number += f',{rng.randint(0, 99)}'
+
+    return number
+
+
+def random_percentage(rng: random.Random) -> str | None:
+    roll = rng.random()
+
+    if roll < 0.05:
+        return None
+
+    if roll < 0.07:
+        return rng.choice(['-', 'n/a'])
+
+    return f'{rng.uniform(0, 100):.{rng.randint(0, 5)}f}'.replace('.', ',') + rng.choice(['', '%', ' %'])
+
+
+def same(scalar, batch: dict, index: int) -> bool:
+    value = batch['values'][index].item() if batch['valid'][index] else None
+
+    if scalar is None or value is None:
+        return scalar is None and value is None
+
+    return scalar == value or (math.isnan(scalar) and math.isnan(value))
+
+
+def timed(function, values):
+    started = time.perf_counter()
+    result = function(values)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--values', type=int, default=500_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # One log line per bad value is what the batch API avoids, keep it out of the timing
+    logging.getLogger('insider_idx_helper.utils.helper').setLevel(logging.CRITICAL)
+
+    rng = random.Random(args.seed)
+    numbers = [random_number(rng) for _ in range(args.values)]
+    percentages = [random_percentage(rng) for _ in range(args.values)]
+
+    for name, values, scalar_function, batch_function in (
+        ('numbers', numbers, clean_number, normalize_numbers),
+        ('percentages', percentages, clean_percentage, normalize_percentages)
+    ):
+        scalar, scalar_seconds = timed(lambda column: [scalar_function(value) for value in column], values)
+        batch, batch_seconds = timed(batch_function, values)
+
+        mismatches = [index for index in range(len(values)) if not same(scalar[index], batch, index)]
+
+        if mismatches:
+            print(f'{name}: {len(mismatches)} mismatches, first {values[mismatches[0]]!r}')
+            sys.exit(1)
+
+        print(
+            f'{name:<12} {len(values)} values, {len(batch["errors"])} bad  '
+            f'scalar {scalar_seconds:.3f}s  batch {batch_seconds:.3f}s  '
+            f'speedup {scalar_seconds / batch_seconds:.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Parser memory as the transaction table grows to 300 pages.
+
+Compares the streamed table lines of extract_prices with the previous
+approach, which kept every page layout and joined the table text into one
+string before splitting it again. Each measurement runs in a fresh process
+so peak RSS is not inherited from an earlier, larger run.
+
+Memory is not constant: the tokenized lines and the parsed rows grow with
+the table either way. The check is on the traced heap peak, the streamed
+path must stay below the joined one at every size. RSS is shown for
+reference only, allocator reuse keeps it flat long after the heap grew.
+
+Usage (from the repository root):
+    python -m benchmarks.page_streaming_memory
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+from insider_idx_helper.parser_idx_helper import (
+    detect_transaction_tables,
+    extract_price_transaction,
+    extract_prices,
+    open_pdf
+)
+from insider_idx_helper.utils.document_text import DocumentText
+from benchmarks.synthetic_idx import write_idx_pdf
+
+import argparse
+import logging
+import multiprocessing
+import resource
+import sys
+import tracemalloc
+
+
+def joined_extract(doc) -> list[dict] | None:
+    document_text = DocumentText(doc)
+    pages = detect_transaction_tables(document_text)['pages']
+
+    combined_text = "\n".join(
+        document_text.text(page_index) for page_index in range(pages[0], pages[-1] + 1)
+    )
+
+    return extract_price_transaction(combined_text)
+
+
+def streamed_extract(doc) -> list[dict] | None:
+    return extract_prices(DocumentText(doc, keep_layout=False))
+
+
+STRATEGIES = {
+    'joined': joined_extract,
+    'streamed': streamed_extract
+}
+
+
+def measure(task: tuple[str, bytes]) -> dict:
+    strategy, pdf_bytes = task
+    logging.disable(logging.INFO)
+
+    doc = open_pdf(pdf_bytes)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    tracemalloc.start()
+    transactions = STRATEGIES[strategy](doc)
+    _, heap_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+    doc.close()
+
+    return {
+        'transactions': len(transactions or []),
+        'heap_peak_mb': heap_peak / 2 ** 20,
+        # ru_maxrss is reported in KB on Linux
+        'rss_growth_mb': rss_growth / 1024
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, nargs='+', default=[30, 100, 300], help='transaction table pages')
+    parser.add_argument('--rows-per-page', type=int, default=8)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+
+    print(f"{'pages':>6} {'strategy':<9} {'rows':>6} {'heap peak MB':>13} {'RSS growth MB':>14}")
+
+    for pages in args.pages:
+        rows = pages * args.rows_per_page
+        pdf_bytes = write_idx_pdf(rows, args.rows_per_page)
+        counts = set()
+        heap_peaks = {}
+
+        for strategy in STRATEGIES:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(measure, (strategy, pdf_bytes)).result()
+
+            counts.add(result['transactions'])
+            heap_peaks[strategy] = result['heap_peak_mb']
+
+            print(
+                f"{pages:>6} {strategy:<9} {result['transactions']:>6} "
+                f"{result['heap_peak_mb']:>13.2f} {result['rss_growth_mb']:>14.2f}"
+            )
+
+        if len(counts) != 1:
+            print(f"FAIL: strategies disagree on {pages} pages")
+            return 1
+
+        if heap_peaks['streamed'] >= heap_peaks['joined']:
+            print(f"FAIL: streamed heap peak not below joined on {pages} pages")
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
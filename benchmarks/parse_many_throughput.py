@@ -0,0 +1,63 @@
+"""
+Throughput of parse_many across worker counts.
+
+Usage (from the repository root):
+    python -m benchmarks.parse_many_throughput path/to/a.pdf path/to/b.pdf --repeat 50
+"""
+from insider_idx_helper.batch_parser import parse_many
+
+import argparse
+import os
+import time
+
+
+def run(paths: list[str], repeat: int, worker_counts: list[int]) -> list[dict]:
+    # Feed bytes so disk caching does not favour later runs
+    documents = []
+    for path in paths:
+        with open(path, 'rb') as file:
+            documents.append(file.read())
+
+    sources = documents * repeat
+    rows = []
+    baseline = None
+
+    for workers in worker_counts:
+        started = time.perf_counter()
+        outcome = parse_many(sources, workers=workers)
+        elapsed = time.perf_counter() - started
+
+        throughput = len(sources) / elapsed
+        baseline = baseline or throughput
+
+        rows.append({
+            'workers': workers,
+            'documents': len(sources),
+            'errors': len(outcome['errors']),
+            'seconds': round(elapsed, 3),
+            'docs_per_second': round(throughput, 1),
+            'speedup': round(throughput / baseline, 2)
+        })
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', help='IDX disclosure PDFs to parse')
+    parser.add_argument('--repeat', type=int, default=25, help='times each document is queued')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f'cpu_count={os.cpu_count()}')
+    print(f"{'workers':>8} {'docs':>6} {'errors':>6} {'seconds':>9} {'docs/s':>8} {'speedup':>8}")
+
+    for row in run(args.paths, args.repeat, args.workers):
+        print(
+            f"{row['workers']:>8} {row['documents']:>6} {row['errors']:>6} "
+            f"{row['seconds']:>9} {row['docs_per_second']:>8} {row['speedup']:>8}"
+        )
+
+
+if __name__ == '__main__':
+    main()
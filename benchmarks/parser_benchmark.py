@@ -0,0 +1,141 @@
+"""
+Per-document latency and memory of parse_document over the synthetic corpus.
+
+Reports p50/p90/p99/max latency and peak Python heap per document, then
+compares p50 and p90 against a stored baseline and exits non-zero on a
+regression beyond --tolerance.
+
+Usage (from the repository root):
+    python -m benchmarks.parser_benchmark --save-baseline   # record on this machine
+    python -m benchmarks.parser_benchmark                   # compare against it
+"""
+from insider_idx_helper.parser_idx_helper import load_company_lookup, open_pdf, parse_document
+from benchmarks.synthetic_idx import CORPUS, build_corpus
+
+import argparse
+import json
+import logging
+import os
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+DEFAULT_BASELINE_PATH = 'benchmarks/parser_baseline.json'
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    position = min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))
+    return ordered[position]
+
+
+def measure(pdf_bytes: bytes, company_lookup, rounds: int) -> dict:
+    latencies = []
+
+    for _ in range(rounds):
+        started = time.perf_counter()
+        doc = open_pdf(pdf_bytes)
+
+        try:
+            parse_document(doc, 'benchmark', company_lookup)
+        finally:
+            doc.close()
+
+        latencies.append(time.perf_counter() - started)
+
+    # Separate traced run, tracing slows the parse down too much to time it
+    tracemalloc.start()
+    doc = open_pdf(pdf_bytes)
+
+    try:
+        parse_document(doc, 'benchmark', company_lookup)
+    finally:
+        doc.close()
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'p50_ms': round(statistics.median(latencies) * 1e3, 3),
+        'p90_ms': round(percentile(latencies, 0.9) * 1e3, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1e3, 3),
+        'max_ms': round(max(latencies) * 1e3, 3),
+        'peak_heap_kb': round(peak / 1024, 1)
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+
+        for metric in ('p50_ms', 'p90_ms'):
+            if current[metric] > previous[metric] * (1 + tolerance):
+                regressions.append(f'{name} {metric}: {previous[metric]} -> {current[metric]}')
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative slowdown')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    company_lookup = load_company_lookup()
+    corpus = build_corpus()
+    pages = {name: len(open_pdf(pdf_bytes)) for name, pdf_bytes in corpus.items()}
+    rows = {name: spec_rows for name, spec_rows, *_ in CORPUS}
+
+    print(f"{'document':<16} {'pages':>5} {'rows':>5} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8} {'heap KB':>8}")
+
+    results = {}
+    for name, pdf_bytes in corpus.items():
+        result = measure(pdf_bytes, company_lookup, args.rounds)
+        results[name] = result
+
+        print(
+            f"{name:<16} {pages[name]:>5} {rows[name]:>5} {result['p50_ms']:>8} {result['p90_ms']:>8} "
+            f"{result['p99_ms']:>8} {result['max_ms']:>8} {result['peak_heap_kb']:>8}"
+        )
+
+    # ru_maxrss is reported in KB on Linux
+    print(f"process peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(results, file, indent=2)
+
+        print(f"baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, run with --save-baseline first")
+        return 0
+
+    with open(args.baseline, 'r') as file:
+        baseline = json.load(file)
+
+    regressions = compare(results, baseline, args.tolerance)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    if not regressions:
+        print(f"no regression beyond {args.tolerance:.0%} against {args.baseline}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Compiled purpose classifier against one substring scan per keyword.
+
+The naive reference lowers the purpose and runs any(keyword in text) for
+each of the nine KEYWORD_* lists, the compiled classifier must return the
+same tags for every purpose before any timing is reported.
+
+Usage (from the repository root):
+    python -m benchmarks.purpose_classifier --purposes 50000 --distinct 2000
+"""
+from insider_idx_helper.utils.purpose_classifier import (
+    PURPOSE_CATEGORIES,
+    PURPOSE_CLASSIFIER,
+    classify_purposes
+)
+
+import argparse
+import random
+import sys
+import time
+
+
+FILLER_WORDS = [
+    'untuk', 'dalam', 'rangka', 'saham', 'efek', 'pribadi', 'melalui', 'pasar',
+    'reguler', 'negosiasi', 'kepada', 'tujuan', 'dan', 'lain', 'rekening', 'perusahaan'
+]
+
+
+def naive_classify(purpose: str | None) -> tuple[str, ...]:
+    if not purpose:
+        return ()
+
+    purpose_lower = purpose.lower()
+
+    return tuple(
+        tag for tag, keywords in PURPOSE_CATEGORIES.items()
+        if any(keyword in purpose_lower for keyword in keywords)
+    )
+
+
+def random_purpose(rng: random.Random, keywords: list[str]) -> str:
+    words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(2, 14))]
+
+    for _ in range(rng.choice([0, 1, 1, 2])):
+        words.insert(rng.randint(0, len(words)), rng.choice(keywords))
+
+    purpose = ' '.join(words)
+
+    return purpose.capitalize() if rng.random() < 0.5 else purpose.upper()
+
+
+def timed(function, purposes: list[str]):
+    started = time.perf_counter()
+    result = function(purposes)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--purposes', type=int, default=50_000)
+    parser.add_argument('--distinct', type=int, default=2_000, help='distinct purposes the column is drawn from')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    keywords = [keyword for words in PURPOSE_CATEGORIES.values() for keyword in words]
+
+    vocabulary = [random_purpose(rng, keywords) for _ in range(args.distinct)]
+    purposes = [rng.choice(vocabulary) for _ in range(args.purposes)]
+
+    naive, naive_seconds = timed(lambda column: [naive_classify(purpose) for purpose in column], purposes)
+    compiled, compiled_seconds = timed(lambda column: [PURPOSE_CLASSIFIER.classify(purpose) for purpose in column], purposes)
+    batch, batch_seconds = timed(classify_purposes, purposes)
+
+    for name, result in (('compiled', compiled), ('batch', batch)):
+        mismatches = [index for index in range(len(purposes)) if result[index] != naive[index]]
+
+        if mismatches:
+            print(f'{name}: {len(mismatches)} mismatches, first {purposes[mismatches[0]]!r}')
+            sys.exit(1)
+
+    print(f'{len(purposes)} purposes, {len(set(purposes))} distinct, identical tags')
+    print(f'naive any(k in text)   {naive_seconds:.3f}s')
+    print(f'compiled, per purpose  {compiled_seconds:.3f}s  {naive_seconds / compiled_seconds:.1f}x')
+    print(f'compiled, batch        {batch_seconds:.3f}s  {naive_seconds / batch_seconds:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
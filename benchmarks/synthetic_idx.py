@@ -0,0 +1,227 @@
+"""
+Synthetic IDX "Laporan Kepemilikan" content for benchmarks.
+
+The line layout mirrors what fitz returns for real IDX attachments: one cell
+fragment per line, the transaction table header repeated on every page.
+write_idx_pdf lays the same cells out in real columns, so both the text and
+the word box table modes of the parser can read it.
+"""
+import fitz
+import os
+import sys
+
+
+HEADER_CELLS = [
+    ["Jenis", "Transaksi"],
+    ["Efek", "Dimiliki", "Secara", "Tidak", "Langsung?"],
+    ["Status", "Kepemilikan"],
+    ["Jumlah", "Saham"],
+    ["Klasifikasi", "Saham"],
+    ["Harga"],
+    ["Tanggal", "Transaksi"],
+    ["Tujuan", "Transaksi"]
+]
+
+TABLE_HEADER = [fragment for cell in HEADER_CELLS for fragment in cell]
+
+# Left edge of every table column, in points
+COLUMN_X = [40, 100, 150, 205, 275, 335, 385, 445]
+
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+PAGE_MARGIN = 40
+FONT_SIZE = 7
+LINE_HEIGHT = 9
+ROW_GAP = 4
+
+TABLE_FOOTER = [
+    "Keterangan",
+    "Saya bertanggung jawab atas kebenaran informasi yang disampaikan"
+]
+
+TRANSACTION_TYPES = {
+    'buy': ["Pembelian"],
+    'sell': ["Penjualan"],
+    'others': ["Lainnya"],
+    'exercise': ["Pelaksanaan", "(exercise)"]
+}
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 'Jul', 'Agu', 'Sep', 'Okt', 'Nov', 'Des']
+
+
+def format_idx_number(value: int, decimals: bool = True) -> str:
+    formatted = f"{value:,}".replace(",", ".")
+    return f"{formatted},00" if decimals else formatted
+
+
+def transaction_cells(row: int, kind: str = 'buy', purpose: list[str] | None = None) -> list[list[str]]:
+    price = "-" if row % 7 == 3 else format_idx_number(1000 + row)
+    date = [f"{row % 28 + 1}-{MONTHS[row % 12]}-", "2025"]
+
+    if purpose is None:
+        purpose = ["Investasi"] if row % 5 else ["Divestasi sebagian", "portofolio investasi"]
+
+    return [
+        TRANSACTION_TYPES[kind],
+        ["Tidak"],
+        ["Langsung"],
+        [format_idx_number((row + 1) * 1000)],
+        ["Saham", "Biasa"],
+        [price],
+        date,
+        purpose
+    ]
+
+
+def transaction_lines(row: int, kind: str = 'buy', purpose: list[str] | None = None) -> list[str]:
+    return [fragment for cell in transaction_cells(row, kind, purpose) for fragment in cell]
+
+
+def table_pages(rows: int, rows_per_page: int = 8, kinds: tuple[str, ...] = ('buy', 'sell')) -> list[list[str]]:
+    """
+    Lines of each transaction table page, the last page ends with the footer
+    """
+    pages = []
+
+    for start in range(0, rows, rows_per_page):
+        lines = list(TABLE_HEADER)
+
+        for row in range(start, min(start + rows_per_page, rows)):
+            lines += transaction_lines(row, kinds[row % len(kinds)])
+
+        pages.append(lines)
+
+    if pages:
+        pages[-1] += TABLE_FOOTER
+    else:
+        pages.append(list(TABLE_HEADER) + TABLE_FOOTER)
+
+    return pages
+
+
+def table_text(rows: int, rows_per_page: int = 8, kinds: tuple[str, ...] = ('buy', 'sell')) -> str:
+    return "\n".join(
+        "\n".join(lines) for lines in table_pages(rows, rows_per_page, kinds)
+    )
+
+
+def cover_lines(
+    holder_name: str = "pt contoh investama",
+    symbol: str = "BBCA",
+    company_name: str = "Bank Central Asia",
+    holding_before: int = 1_000_000,
+    holding_after: int = 1_250_000
+) -> list[str]:
+    return [
+        "Laporan Kepemilikan atau Setiap Perubahan Kepemilikan Saham",
+        f"Nama (sesuai SID) : {holder_name}",
+        f"Nama Perusahaan Tbk : {symbol} - {company_name}",
+        "Tbk",
+        f"Jumlah Saham Sebelum Transaksi : {format_idx_number(holding_before, decimals=False)}",
+        f"Jumlah Saham Setelah Transaksi : {format_idx_number(holding_after, decimals=False)}",
+        "Hak Suara Sebelum Transaksi : 1,5 %",
+        "Hak Suara Setelah Transaksi : 2,25 %"
+    ]
+
+
+def write_lines(page: fitz.Page, lines: list[str], y: float = PAGE_MARGIN) -> float:
+    for line in lines:
+        page.insert_text((PAGE_MARGIN, y), line, fontsize=FONT_SIZE)
+        y += LINE_HEIGHT
+
+    return y
+
+
+def write_row(page: fitz.Page, cells: list[list[str]], y: float) -> float:
+    # Cells are written column by column so plain text extraction keeps the line order
+    for x, cell in zip(COLUMN_X, cells):
+        for offset, fragment in enumerate(cell):
+            page.insert_text((x, y + offset * LINE_HEIGHT), fragment, fontsize=FONT_SIZE)
+
+    return y + max(len(cell) for cell in cells) * LINE_HEIGHT + ROW_GAP
+
+
+def write_idx_pdf(
+    rows: int,
+    rows_per_page: int = 8,
+    kinds: tuple[str, ...] = ('buy', 'sell'),
+    appendix_pages: int = 0,
+    **cover
+) -> bytes:
+    """
+    A complete synthetic disclosure: cover page, transaction table pages
+    (header repeated per page) and optional appendix pages, as PDF bytes.
+    """
+    doc = fitz.open()
+    write_lines(doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT), cover_lines(**cover))
+
+    page = None
+    y = PAGE_HEIGHT
+    rows_on_page = 0
+
+    for row in range(rows):
+        cells = transaction_cells(row, kinds[row % len(kinds)])
+        row_height = max(len(cell) for cell in cells) * LINE_HEIGHT + ROW_GAP
+
+        if page is None or rows_on_page >= rows_per_page or y + row_height > PAGE_HEIGHT - PAGE_MARGIN:
+            page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+            y = write_row(page, HEADER_CELLS, PAGE_MARGIN)
+            rows_on_page = 0
+
+        y = write_row(page, cells, y)
+        rows_on_page += 1
+
+    if page is None:
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        y = write_row(page, HEADER_CELLS, PAGE_MARGIN)
+
+    write_lines(page, TABLE_FOOTER, y + LINE_HEIGHT)
+
+    for appendix in range(appendix_pages):
+        write_lines(
+            doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT),
+            ["Lampiran", f"Dokumen pendukung {appendix + 1}", "Tanda tangan dan cap perusahaan"]
+        )
+
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    return pdf_bytes
+
+
+# Default corpus: (name, rows, rows_per_page, kinds, appendix_pages)
+CORPUS = [
+    ('single_row', 1, 8, ('buy',), 0),
+    ('small_mixed', 6, 8, ('buy', 'sell'), 1),
+    ('multi_page', 40, 10, ('buy', 'sell', 'others', 'exercise'), 2),
+    ('long_appendix', 12, 8, ('sell',), 40),
+    ('mesop_daily', 250, 25, ('exercise', 'others'), 4)
+]
+
+
+def build_corpus(corpus: list[tuple] = CORPUS) -> dict[str, bytes]:
+    return {
+        name: write_idx_pdf(rows, rows_per_page, kinds, appendix_pages)
+        for name, rows, rows_per_page, kinds, appendix_pages in corpus
+    }
+
+
+def write_corpus(directory: str, corpus: list[tuple] = CORPUS) -> list[str]:
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+
+    for name, pdf_bytes in build_corpus(corpus).items():
+        path = os.path.join(directory, f'{name}.pdf')
+
+        with open(path, 'wb') as file:
+            file.write(pdf_bytes)
+
+        paths.append(path)
+
+    return paths
+
+
+if __name__ == '__main__':
+    # python -m benchmarks.synthetic_idx <directory>
+    for path in write_corpus(sys.argv[1] if len(sys.argv) > 1 else 'synthetic_idx'):
+        print(path)
@@ -0,0 +1,60 @@
+"""
+Text vs word box table extraction in extract_prices.
+
+Each round opens the synthetic PDF fresh, so page text extraction is part of
+the measured time, as it is in production.
+
+Usage (from the repository root):
+    python -m benchmarks.table_mode_comparison --rows 20 100 400
+"""
+from insider_idx_helper.parser_idx_helper import (
+    TABLE_MODE_TEXT,
+    TABLE_MODE_WORDS,
+    extract_prices
+)
+from benchmarks.synthetic_idx import write_idx_pdf
+
+import argparse
+import fitz
+import logging
+import time
+
+
+def best_time(pdf_bytes: bytes, table_mode: str, rounds: int) -> tuple[float, list[dict]]:
+    best = float('inf')
+    transactions = None
+
+    for _ in range(rounds):
+        doc = fitz.open(stream=pdf_bytes, filetype='pdf')
+        started = time.perf_counter()
+        transactions = extract_prices(doc, table_mode)
+        best = min(best, time.perf_counter() - started)
+        doc.close()
+
+    return best, transactions or []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[20, 100, 400])
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{'rows':>6} {'text ms':>9} {'words ms':>9} {'ratio':>7} {'same':>5}")
+
+    for rows in args.rows:
+        pdf_bytes = write_idx_pdf(rows, kinds=('buy', 'sell', 'others', 'exercise'), appendix_pages=2)
+
+        text_time, text_transactions = best_time(pdf_bytes, TABLE_MODE_TEXT, args.rounds)
+        words_time, words_transactions = best_time(pdf_bytes, TABLE_MODE_WORDS, args.rounds)
+
+        print(
+            f"{rows:>6} {text_time * 1e3:>9.2f} {words_time * 1e3:>9.2f} "
+            f"{text_time / words_time:>7.2f} {str(text_transactions == words_transactions):>5}"
+        )
+
+
+if __name__ == '__main__':
+    main()
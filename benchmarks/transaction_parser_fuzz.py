@@ -0,0 +1,175 @@
+"""
+Randomized worst-case search for extract_price_transaction.
+
+Every case draws a shape, the probability of each layout mutation, then
+builds line streams of that shape at growing row counts. A case fails when
+its time per line at the largest size exceeds the smallest by more than
+--tolerance, or when the parser raises. Runs are reproducible from --seed.
+
+Mutations target the look-ahead paths of the parser: purposes spanning many
+lines full of transaction keywords and ownership markers, rows without a
+"Saham" anchor, table headers repeated or cut mid-row, dates without a year
+and rows without any date.
+
+Usage (from the repository root):
+    python -m benchmarks.transaction_parser_fuzz --cases 50
+"""
+from insider_idx_helper.parser_idx_helper import TRANSACTION_KEYWORDS, extract_price_transaction
+from benchmarks.synthetic_idx import MONTHS, TABLE_FOOTER, TABLE_HEADER, TRANSACTION_TYPES, transaction_lines
+
+import argparse
+import logging
+import random
+import sys
+import time
+
+
+MUTATIONS = (
+    'keyword_purpose',
+    'long_purpose',
+    'missing_saham',
+    'repeated_header',
+    'truncated_header',
+    'truncated_date',
+    'missing_date',
+    'no_footer'
+)
+
+PURPOSE_NOISE = TRANSACTION_KEYWORDS + ["Tidak", "Ya", "Langsung", "Saham", "-", "1.000,00", "Jenis", "Transaksi"]
+
+
+def draw_shape(rng: random.Random) -> dict[str, float]:
+    # Extremes are drawn often, they are where quadratic paths would show
+    return {mutation: rng.choice((0.0, 0.0, 0.1, 0.5, 1.0)) for mutation in MUTATIONS}
+
+
+def fuzz_row(rng: random.Random, row: int, shape: dict[str, float]) -> list[str]:
+    kind = rng.choice(list(TRANSACTION_TYPES))
+    purpose = ["Investasi"]
+
+    if rng.random() < shape['long_purpose']:
+        purpose = [f"Bagian {part} dari rencana investasi" for part in range(rng.randint(20, 60))]
+
+    if rng.random() < shape['keyword_purpose']:
+        purpose = [rng.choice(PURPOSE_NOISE) for _ in range(rng.randint(5, 40))] + purpose
+
+    lines = transaction_lines(row, kind, purpose)
+
+    if rng.random() < shape['missing_saham']:
+        lines = [line for line in lines if line != "Saham"]
+
+    if rng.random() < shape['missing_date']:
+        lines = [line for line in lines if line != "2025" and not line.endswith(tuple(f"{month}-" for month in MONTHS))]
+
+    elif rng.random() < shape['truncated_date']:
+        lines = [line for line in lines if line != "2025"]
+
+    if rng.random() < shape['repeated_header']:
+        lines = TABLE_HEADER + lines
+
+    if rng.random() < shape['truncated_header']:
+        # A page break cutting the header before "Tujuan Transaksi"
+        lines = TABLE_HEADER[:rng.randint(2, len(TABLE_HEADER) - 2)] + lines
+
+    return lines
+
+
+def fuzz_stream(seed: int, shape: dict[str, float], rows: int) -> str:
+    rng = random.Random(seed)
+    lines = list(TABLE_HEADER)
+
+    for row in range(rows):
+        lines += fuzz_row(rng, row, shape)
+
+    if rng.random() >= shape['no_footer']:
+        lines += TABLE_FOOTER
+
+    return "\n".join(lines)
+
+
+def time_per_line(text: str, rounds: int) -> float:
+    line_count = text.count("\n") + 1
+    best = float('inf')
+
+    for _ in range(rounds):
+        started = time.perf_counter()
+        extract_price_transaction(text)
+        best = min(best, time.perf_counter() - started)
+
+    return best / line_count
+
+
+def run_case(case_seed: int, sizes: list[int], rounds: int) -> dict:
+    shape = draw_shape(random.Random(case_seed))
+    per_line = []
+    lines = []
+
+    for rows in sizes:
+        text = fuzz_stream(case_seed, shape, rows)
+        lines.append(text.count("\n") + 1)
+        per_line.append(time_per_line(text, rounds))
+
+    return {
+        'seed': case_seed,
+        'shape': {mutation: weight for mutation, weight in shape.items() if weight},
+        'lines': lines,
+        'growth': per_line[-1] / per_line[0]
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cases', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--rows', type=int, nargs='+', default=[50, 200, 800])
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--tolerance', type=float, default=2.0, help='allowed growth of time per line')
+    parser.add_argument('--show', type=int, default=5, help='worst cases to print')
+    args = parser.parse_args()
+
+    # extract_price_transaction logs every transaction at INFO and swallows
+    # its own errors, they are surfaced through ERROR records instead
+    logging.disable(logging.INFO)
+    errors = []
+
+    class ErrorCollector(logging.Handler):
+        def emit(self, record):
+            errors.append(record.getMessage())
+
+    logging.getLogger('insider_idx_helper.parser_idx_helper').addHandler(ErrorCollector(logging.ERROR))
+
+    # Garbage cells are expected here, the number and date helpers log each one
+    logging.getLogger('insider_idx_helper.utils.helper').setLevel(logging.CRITICAL)
+
+    results = []
+    for case in range(args.cases):
+        case_seed = args.seed * 1_000_003 + case
+        errors.clear()
+
+        result = run_case(case_seed, args.rows, args.rounds)
+        results.append(result)
+
+        if errors:
+            print(f"FAIL: seed {case_seed} raised in the parser: {errors[0]}")
+            print(f"  shape {result['shape']}")
+            return 1
+
+    results.sort(key=lambda result: result['growth'], reverse=True)
+
+    print(f"{'seed':>10} {'lines':>22} {'growth':>7}  shape")
+    for result in results[:args.show]:
+        lines = '/'.join(map(str, result['lines']))
+        print(f"{result['seed']:>10} {lines:>22} {result['growth']:>6.2f}x  {result['shape']}")
+
+    failures = [result for result in results if result['growth'] > args.tolerance]
+
+    if failures:
+        print(f"FAIL: {len(failures)} of {len(results)} cases grow faster than linear, rerun with --seed {args.seed}")
+        return 1
+
+    print(f"all {len(results)} cases within {args.tolerance:.1f}x time per line growth")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
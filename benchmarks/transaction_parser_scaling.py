@@ -0,0 +1,67 @@
+"""
+Checks that extract_price_transaction runs in O(lines).
+
+Times tables of growing row counts and fails when the time per line at the
+largest size exceeds the smallest by more than --tolerance.
+
+Usage (from the repository root):
+    python -m benchmarks.transaction_parser_scaling
+"""
+from insider_idx_helper.parser_idx_helper import extract_price_transaction
+from benchmarks.synthetic_idx import table_text
+
+import argparse
+import logging
+import sys
+import time
+
+
+def time_per_line(text: str, rounds: int) -> float:
+    line_count = text.count("\n") + 1
+    best = float('inf')
+
+    for _ in range(rounds):
+        started = time.perf_counter()
+        extract_price_transaction(text)
+        best = min(best, time.perf_counter() - started)
+
+    return best / line_count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[50, 200, 800, 3200])
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--tolerance', type=float, default=2.0, help='allowed growth of time per line')
+    args = parser.parse_args()
+
+    # The parser logs every transaction at INFO
+    logging.disable(logging.INFO)
+
+    print(f"{'rows':>6} {'lines':>7} {'parsed':>7} {'us/line':>9}")
+    per_line = []
+
+    for rows in args.rows:
+        text = table_text(rows)
+        parsed = extract_price_transaction(text) or []
+        cost = time_per_line(text, args.rounds)
+        per_line.append(cost)
+
+        print(f"{rows:>6} {text.count(chr(10)) + 1:>7} {len(parsed):>7} {cost * 1e6:>9.2f}")
+
+        if len(parsed) != rows:
+            print(f"FAIL: parsed {len(parsed)} of {rows} rows")
+            return 1
+
+    growth = per_line[-1] / per_line[0]
+    print(f"time per line grew {growth:.2f}x from {args.rows[0]} to {args.rows[-1]} rows")
+
+    if growth > args.tolerance:
+        print("FAIL: runtime grows faster than linear")
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
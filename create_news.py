@@ -1,10 +1,11 @@
 import streamlit as st
 from datetime import datetime as dt
-import requests
+from insider_idx_helper.utils.date_format import parse_timestamp
+from utils.news_api import get_news_api
 import json
 
 # data
-api_key = st.secrets["API_KEY"]
+news_api = get_news_api(st.secrets["API_KEY"])
 
 available_subsectors = [
   "alternative-energy",
@@ -51,16 +52,10 @@ def generate():
     if not st.session_state.source or not st.session_state.date or not st.session_state.time:
         st.toast("Please fill out the required fields.")
     else:
-        data = {
-            "source": st.session_state.source,
-            "timestamp": dt.combine(st.session_state.date, st.session_state.time).strftime("%Y-%m-%d %H:%M:%S")
-        }
-
-        headers = {
-            "Authorization": f"Bearer {api_key}"
-        }
-
-        response = requests.post("https://sectors-news-endpoint.fly.dev/url-article", headers = headers, json=data)
+        response = news_api.generate_article(
+            source=st.session_state.source,
+            timestamp=dt.combine(st.session_state.date, st.session_state.time).strftime("%Y-%m-%d %H:%M:%S")
+        )
         if response.status_code == 200:
             autogenerated = response.json()
             st.session_state.title=autogenerated["title"]
@@ -97,15 +92,11 @@ def post():
             "dimension": json.loads(st.session_state.dimension)
         }
 
-        headers = {
-            "Authorization": f"Bearer {api_key}"
-        }
-
         if st.session_state.edit != False:
             data["id"] = st.session_state.edit
-            response = requests.patch("https://sectors-news-endpoint.fly.dev/articles", headers = headers, json=data)
+            response = news_api.update_article(data)
         else:
-            response = requests.post("https://sectors-news-endpoint.fly.dev/url-article/post", headers = headers, json=data)
+            response = news_api.post_article(data)
 
         if response.status_code == 200:
             st.toast("News submitted successfully! 🎉")
@@ -124,13 +115,10 @@ def post():
         elif response.status_code == 400:
             st.toast("Duplicated news. Please review the content.")
             dup = response.json()
-            res_prev = requests.get(f"https://sectors-news-endpoint.fly.dev/articles?id={dup['id_duplicate']}", headers = headers)
+            res_prev = news_api.get_articles(dup['id_duplicate'])
             if res_prev.status_code == 200:
                 prev = res_prev.json()[0]
-                try:
-                    timestamp = dt.strptime(prev["timestamp"], "%Y-%m-%dT%H:%M:%S.%f")
-                except ValueError:
-                    timestamp = dt.strptime(prev["timestamp"], "%Y-%m-%dT%H:%M:%S")
+                timestamp = parse_timestamp(prev["timestamp"])
                 st.session_state.title=prev["title"]
                 st.session_state.body=prev["body"]
                 st.session_state.source=prev["source"]
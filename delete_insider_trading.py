@@ -1,17 +1,13 @@
 import streamlit as st
 from datetime import datetime as dt
-import requests
+from utils.news_api import get_news_api
 
 # data
-api_key = st.secrets["API_KEY"]
+news_api = get_news_api(st.secrets["API_KEY"])
 
 # helper functions
 def fetch():
-    headers = {
-        "Authorization": f"Bearer {api_key}"
-    }
-
-    response = requests.get("https://sectors-news-endpoint.fly.dev/insider-trading", headers = headers)
+    response = news_api.get_insider_trading()
 
     if response.status_code == 200:
         return response.json()
@@ -21,14 +17,7 @@ def fetch():
 data = fetch()
 
 def delete():
-    headers = {
-        "Authorization": f"Bearer {api_key}"
-    }
-
-    deleted = {
-        "id_list": st.session_state.ids
-    }
-    response = requests.delete(f"https://sectors-news-endpoint.fly.dev/insider-trading", headers = headers, json=deleted)
+    response = news_api.delete_insider_trading(st.session_state.ids)
 
     if response.status_code != 200:
         # Handle error
@@ -1,16 +1,17 @@
 from datetime import datetime as dt
 from supabase import create_client
+from insider_idx_helper.utils.date_format import parse_date, parse_timestamp
+from utils.news_api import get_news_api
 # from edit_insider_trading_function import update_insider_trading_supabase
 
 import streamlit as st
 import uuid
-import requests
 import pandas as pd 
 import traceback
 
 
 # Setup env
-API_KEY = st.secrets["API_KEY"]
+NEWS_API = get_news_api(st.secrets["API_KEY"])
 SUPABASE_URL = st.secrets["SUPABASE_URL"]
 SUPABASE_KEY = st.secrets["SUPABASE_KEY"]
 
@@ -80,10 +81,7 @@ def edit():
         prev_data = next((item for item in data if item["id"] == selected_id), None)
 
         if prev_data:
-            try:
-                timestamp = dt.strptime(prev_data["timestamp"], "%Y-%m-%dT%H:%M:%S.%f")
-            except ValueError:
-                timestamp = dt.strptime(prev_data["timestamp"], "%Y-%m-%dT%H:%M:%S")
+            timestamp = parse_timestamp(prev_data["timestamp"])
 
             st.session_state.pdf_edit_uid=prev_data["UID"]
             st.session_state.pdf_edit_source=prev_data["source"]
@@ -174,20 +172,12 @@ def post():
             'price_transaction': final_transactions
         }
 
-        headers = {
-            "Authorization": f"Bearer {API_KEY}"
-        }
-        
         st.write(data)
 
         # update_insider_trading_supabase(data, True)
 
         try:
-            response = requests.patch(
-                "https://sectors-news-endpoint.fly.dev/insider-trading", 
-                headers = headers, 
-                json=data
-            )
+            response = NEWS_API.update_insider_trading(data)
 
             if response.status_code == 200:
                 st.toast("Insider trading editted successfully! 🎉")
@@ -494,7 +484,7 @@ def main_ui():
             
             transaction_date = transaction.get('date')
             if transaction_date:
-                display_date = dt.strptime(transaction_date, "%Y-%m-%d").date()
+                display_date = parse_date(transaction_date)
             else:
                 display_date = dt.now().strftime("%Y-%m-%d")
 
@@ -1,10 +1,11 @@
 import streamlit as st
 from datetime import datetime as dt
-import requests
+from insider_idx_helper.utils.date_format import parse_timestamp
+from utils.news_api import get_news_api
 import json
 
 # data
-api_key = st.secrets["API_KEY"]
+news_api = get_news_api(st.secrets["API_KEY"])
 
 available_subsectors = [
   "alternative-energy",
@@ -44,11 +45,7 @@ available_subsectors = [
 
 # helper functions
 def fetch():
-    headers = {
-        "Authorization": f"Bearer {api_key}"
-    }
-
-    response = requests.get("https://sectors-news-endpoint.fly.dev/articles", headers = headers)
+    response = news_api.get_articles()
 
     if response.status_code == 200:
         return response.json()
@@ -66,10 +63,7 @@ def edit():
         st.session_state.view_edit = "view2"
         prev_data = next((item for item in data if item["id"] == selected_id), None)
         if prev_data:
-            try:
-                timestamp = dt.strptime(prev_data["timestamp"], "%Y-%m-%dT%H:%M:%S.%f")
-            except ValueError:
-                timestamp = dt.strptime(prev_data["timestamp"], "%Y-%m-%dT%H:%M:%S")
+            timestamp = parse_timestamp(prev_data["timestamp"])
             st.session_state.edit_title=prev_data["title"]
             st.session_state.edit_body=prev_data["body"]
             st.session_state.edit_source=prev_data["source"]
@@ -105,11 +99,7 @@ def post():
             "score": st.session_state.edit_score
         }
 
-        headers = {
-            "Authorization": f"Bearer {api_key}"
-        }
-
-        response = requests.patch(f"https://sectors-news-endpoint.fly.dev/articles", headers = headers, json=data)
+        response = news_api.update_article(data)
 
         if response.status_code == 200:
             st.toast("News editted successfully! 🎉")
@@ -0,0 +1,193 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import BinaryIO, Callable
+
+from insider_idx_helper.parser_idx_helper import (
+    COMPANIES_PATH,
+    TABLE_MODE_TEXT,
+    load_company_lookup,
+    open_pdf,
+    parse_document
+)
+from insider_idx_helper.parse_cache import parse_with_cache, read_pdf_bytes
+from insider_idx_helper.utils.stage_timer import StageTimer, emit_timings
+
+import logging
+import multiprocessing
+import os
+import threading
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Loaded once per worker process by init_worker
+WORKER_COMPANY_LOOKUP = None
+
+# Long lived pool for interactive callers, see submit_parse
+SHARED_EXECUTOR = None
+SHARED_EXECUTOR_LOCK = threading.Lock()
+SHARED_WORKERS = 2
+
+
+def init_worker(companies_path: str = COMPANIES_PATH):
+    global WORKER_COMPANY_LOOKUP
+    WORKER_COMPANY_LOOKUP = load_company_lookup(companies_path)
+
+
+def parse_source(task: tuple[str | bytes, str]) -> tuple[list[dict] | None, str | None, dict]:
+    source, pdf_url = task
+    timer = StageTimer(pdf_url)
+
+    try:
+        with timer.stage('open_pdf'):
+            doc = open_pdf(source)
+
+        try:
+            result = parse_document(doc, pdf_url, WORKER_COMPANY_LOOKUP, timer=timer)
+
+        finally:
+            doc.close()
+
+        return result, None, timer.report()
+
+    except Exception as error:
+        LOGGER.error(f'parse source error {pdf_url}: {error}')
+        return None, f'{type(error).__name__}: {error}', timer.report()
+
+
+def parse_many(
+    paths_or_bytes: list[str | bytes],
+    pdf_urls: list[str] | None = None,
+    workers: int | None = None,
+    companies_path: str = COMPANIES_PATH
+) -> dict:
+    """
+    Parse many IDX disclosures across a process pool.
+
+    Results keep the input order, a failed document leaves None in its slot
+    and its message in errors, keyed by input index. Stage timings of every
+    document come back in timings, in input order, and are emitted to the
+    timing sink of this process.
+    """
+    if pdf_urls is None:
+        pdf_urls = [
+            source if isinstance(source, str) else f'document-{index}'
+            for index, source in enumerate(paths_or_bytes)
+        ]
+
+    if len(pdf_urls) != len(paths_or_bytes):
+        raise ValueError('pdf_urls must match paths_or_bytes in length')
+
+    tasks = list(zip(paths_or_bytes, pdf_urls))
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(tasks) <= 1:
+        init_worker(companies_path)
+        outcomes = [parse_source(task) for task in tasks]
+
+    else:
+        chunksize = max(1, len(tasks) // (workers * 4))
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(companies_path,)
+        ) as executor:
+            outcomes = list(executor.map(parse_source, tasks, chunksize=chunksize))
+
+    results = []
+    errors = {}
+    timings = []
+
+    for index, (result, error, timing) in enumerate(outcomes):
+        results.append(result)
+        timings.append(timing)
+        emit_timings(timing)
+
+        if error is not None:
+            errors[index] = error
+
+    return {
+        'results': results,
+        'errors': errors,
+        'timings': timings
+    }
+
+
+def create_parse_executor(workers: int, companies_path: str = COMPANIES_PATH) -> ProcessPoolExecutor:
+    """
+    Pool for long lived callers. Workers are spawned rather than forked
+    because the calling process is already running threads.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=init_worker,
+        initargs=(companies_path,)
+    )
+
+
+def get_shared_executor(companies_path: str = COMPANIES_PATH) -> ProcessPoolExecutor:
+    """
+    Created on first use and kept for the life of the process, so a request
+    does not pay for worker start up
+    """
+    global SHARED_EXECUTOR
+
+    with SHARED_EXECUTOR_LOCK:
+        if SHARED_EXECUTOR is None:
+            SHARED_EXECUTOR = create_parse_executor(SHARED_WORKERS, companies_path)
+
+        return SHARED_EXECUTOR
+
+
+def reset_shared_executor(failed: ProcessPoolExecutor):
+    """
+    Drop the shared pool if it is still the one that failed, another
+    thread may have replaced it already
+    """
+    global SHARED_EXECUTOR
+
+    with SHARED_EXECUTOR_LOCK:
+        if SHARED_EXECUTOR is failed:
+            SHARED_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+            SHARED_EXECUTOR = None
+
+
+def submit_restarting(
+    get_executor: Callable[[], ProcessPoolExecutor],
+    restart_executor: Callable[[ProcessPoolExecutor], None],
+    pdf_bytes: bytes,
+    pdf_url: str,
+    table_mode: str = TABLE_MODE_TEXT
+) -> Future:
+    """
+    parse_with_cache in the pool get_executor returns. A worker that died,
+    e.g. killed for memory, breaks the whole pool, so it is restarted and
+    the parse submitted once more. restart_executor gets the broken pool
+    and only replaces it if nobody did so in the meantime.
+    """
+    executor = get_executor()
+
+    try:
+        return executor.submit(parse_with_cache, pdf_bytes, pdf_url, table_mode)
+
+    except BrokenProcessPool:
+        LOGGER.error('parse pool broken, restarting')
+        restart_executor(executor)
+
+        return get_executor().submit(parse_with_cache, pdf_bytes, pdf_url, table_mode)
+
+
+def submit_parse(
+    pdf_source: str | bytes | BinaryIO,
+    pdf_url: str,
+    table_mode: str = TABLE_MODE_TEXT
+) -> Future:
+    """
+    Parse one document in the shared pool, through the parse cache.
+    The future raises whatever the parse raised, so callers can report
+    errors per document.
+    """
+    # Uploads are not picklable, only their bytes cross the process boundary
+    return submit_restarting(get_shared_executor, reset_shared_executor, read_pdf_bytes(pdf_source), pdf_url, table_mode)
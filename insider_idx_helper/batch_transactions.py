@@ -0,0 +1,220 @@
+import logging
+import numpy as np
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Row kinds and derived filing types as small integer codes
+KIND_BUY = 0
+KIND_SELL = 1
+KIND_OTHERS = 2
+
+TYPE_NAMES = {KIND_BUY: 'buy', KIND_SELL: 'sell', KIND_OTHERS: 'others'}
+KIND_CODES = {'buy': KIND_BUY, 'sell': KIND_SELL}
+
+
+# Not number_format: stored rows hold numbers the parser already normalized,
+# where "125.5" is a price of 125.5 and not the Indonesian 1255. These are
+# the int() and float() conversions compute_transactions applies to them.
+def to_amount(value) -> int | None:
+    try:
+        return int(value or 0)
+
+    except (TypeError, ValueError):
+        return None
+
+
+def to_price(value) -> float | None:
+    try:
+        return float(value or 0.0)
+
+    except (TypeError, ValueError):
+        return None
+
+
+def flatten_price_transactions(price_transaction_lists: list[list[dict] | None]) -> dict[str, np.ndarray]:
+    """
+    Columnar view of many filings' price_transaction lists, one entry per
+    transaction row, converted the way compute_transactions converts them.
+    A filing with a row that cannot be converted is marked invalid.
+    """
+    counts = [len(price_transactions) if price_transactions else 0 for price_transactions in price_transaction_lists]
+    rows = [
+        transaction
+        for price_transactions in price_transaction_lists if price_transactions
+        for transaction in price_transactions
+    ]
+
+    filing_index = np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+
+    # Plain ints and floats, nearly every row, skip the converter call
+    amounts = [transaction.get('amount_transacted') for transaction in rows]
+    amounts = [amount if type(amount) is int else to_amount(amount) for amount in amounts]
+
+    prices = [transaction.get('price') for transaction in rows]
+    prices = [price if type(price) is float and price else to_price(price) for price in prices]
+
+    types = [transaction.get('type') for transaction in rows]
+    type_codes = {
+        transaction_type: KIND_CODES.get(str(transaction_type).lower(), KIND_OTHERS)
+        for transaction_type in set(types)
+    }
+    kinds = [type_codes[transaction_type] for transaction_type in types]
+
+    valid = np.array(counts, dtype=np.int64) > 0
+
+    if None in amounts or None in prices:
+        bad_rows = [index for index, (amount, price) in enumerate(zip(amounts, prices)) if amount is None or price is None]
+
+        for row in bad_rows:
+            amounts[row] = 0
+            prices[row] = 0.0
+
+        bad_filings = np.unique(filing_index[bad_rows])
+        LOGGER.error(f'flatten price transaction: {len(bad_filings)} filings with unconvertible rows')
+        valid[bad_filings] = False
+
+    amount = np.array(amounts, dtype=np.int64)
+    price = np.array(prices, dtype=np.float64)
+
+    # Rows of invalid filings stay in place but count for nothing
+    keep = valid[filing_index]
+
+    return {
+        'filing_index': filing_index[keep],
+        'amount': amount[keep],
+        'price': price[keep],
+        'kind': np.array(kinds, dtype=np.int8)[keep],
+        'valid': valid
+    }
+
+
+def grouped_sum(filing_index: np.ndarray, values: np.ndarray, mask: np.ndarray, filing_count: int) -> np.ndarray:
+    """
+    Per filing sum of the masked values, added in row order like the scalar loop
+    """
+    if values.dtype.kind == 'f':
+        return np.bincount(filing_index[mask], weights=values[mask], minlength=filing_count)
+
+    totals = np.zeros(filing_count, dtype=values.dtype)
+    np.add.at(totals, filing_index[mask], values[mask])
+
+    return totals
+
+
+def compute_transactions_columnar(
+    filing_index: np.ndarray,
+    amount: np.ndarray,
+    price: np.ndarray,
+    kind: np.ndarray,
+    filing_count: int
+) -> dict[str, np.ndarray]:
+    """
+    compute_transactions for every filing at once, from flat row arrays.
+    Returns per filing arrays: unrounded weighted average price, transaction
+    value, a KIND_* code of the derived type and net shares transacted.
+    """
+    value = amount * price
+
+    is_buy = kind == KIND_BUY
+    is_sell = kind == KIND_SELL
+    is_others = kind == KIND_OTHERS
+
+    buy_shares = grouped_sum(filing_index, amount, is_buy, filing_count)
+    sell_shares = grouped_sum(filing_index, amount, is_sell, filing_count)
+    others_shares = grouped_sum(filing_index, amount, is_others, filing_count)
+
+    buy_value = grouped_sum(filing_index, value, is_buy, filing_count)
+    sell_value = grouped_sum(filing_index, value, is_sell, filing_count)
+    others_value = grouped_sum(filing_index, value, is_others, filing_count)
+
+    has_buy_sell = np.bincount(filing_index[is_buy | is_sell], minlength=filing_count) > 0
+
+    # Buy and sell rows net out, other rows only count when there are none
+    net_shares = np.where(has_buy_sell, buy_shares - sell_shares, others_shares)
+    net_value = np.where(has_buy_sell, buy_value - sell_value, others_value)
+
+    has_divisor = np.where(has_buy_sell, net_shares != 0, others_shares > 0)
+    average_price = np.divide(net_value, net_shares, out=np.zeros(filing_count), where=has_divisor)
+    average_price = np.where(has_buy_sell, np.abs(average_price), average_price)
+
+    transaction_type = np.full(filing_count, KIND_OTHERS, dtype=np.int8)
+    transaction_type[has_buy_sell & (net_shares > 0)] = KIND_BUY
+    transaction_type[has_buy_sell & (net_shares < 0)] = KIND_SELL
+
+    return {
+        'price': average_price,
+        'transaction_value': np.abs(np.trunc(net_value)).astype(np.int64),
+        'transaction_type': transaction_type,
+        'net_shares_transacted': net_shares
+    }
+
+
+def compute_transactions_batch(price_transaction_lists: list[list[dict] | None]) -> list[dict]:
+    """
+    Same output as calling compute_transactions on each list, an empty dict
+    for filings without rows or with rows that cannot be converted
+    """
+    columns = flatten_price_transactions(price_transaction_lists)
+    filing_count = len(price_transaction_lists)
+
+    computed = compute_transactions_columnar(
+        columns['filing_index'],
+        columns['amount'],
+        columns['price'],
+        columns['kind'],
+        filing_count
+    )
+
+    type_names = [TYPE_NAMES[code] for code in computed['transaction_type'].tolist()]
+
+    # Python round, numpy rounds halves differently
+    results = [
+        {
+            "price": round(price, 3),
+            "transaction_value": value,
+            "transaction_type": transaction_type,
+            "net_shares_transacted": net_shares
+        } if is_valid else {}
+        for is_valid, price, value, transaction_type, net_shares in zip(
+            columns['valid'].tolist(),
+            computed['price'].tolist(),
+            computed['transaction_value'].tolist(),
+            type_names,
+            computed['net_shares_transacted'].tolist()
+        )
+    ]
+
+    return results
+
+
+def enrich_transactions_batch(filings: list[dict], filing_type: str = 'split') -> list[dict]:
+    """
+    enrich_transaction over many filings, updated in place and returned.
+    Turning dict rows into columns costs about what the scalar loop does,
+    so this only pays off for rows that already arrive as columns, see
+    compute_transactions_columnar.
+    """
+    computed = compute_transactions_batch([filing.get('price_transaction', []) for filing in filings])
+
+    for filing, transaction_computed in zip(filings, computed):
+        filing['price'] = transaction_computed.get('price')
+        filing['transaction_value'] = transaction_computed.get('transaction_value')
+        filing['transaction_type'] = transaction_computed.get('transaction_type')
+        filing['net_shares_transacted'] = transaction_computed.get('net_shares_transacted')
+
+        try:
+            if filing_type == 'split':
+                filing['amount_transaction'] = sum(
+                    transaction.get('amount_transacted', 0)
+                    for transaction in filing.get('price_transaction', [])
+                )
+
+            elif filing_type == 'combine':
+                filing['amount_transaction'] = abs(filing.get('holding_before', 0) - filing.get('holding_after', 0))
+
+        except Exception as error:
+            LOGGER.error(f'Error enrich_transactions_batch: {error}')
+
+    return filings
+
@@ -0,0 +1,191 @@
+from insider_idx_helper.parser_idx_helper import (
+    PARSER_VERSION,
+    TABLE_MODE_TEXT,
+    iter_parser_new_document
+)
+
+from typing import BinaryIO, Iterator
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = '.cache/idx_parse_cache.sqlite3'
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def make_cache_key(pdf_bytes: bytes, table_mode: str = TABLE_MODE_TEXT) -> str:
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+    return f'{digest}:{PARSER_VERSION}:{table_mode}'
+
+
+class ParseCache:
+    """
+    Parse results on local disk, keyed by PDF content and parser version.
+    Least recently used entries are evicted once the payloads exceed max_bytes.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS parse_cache (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS parse_cache_last_used ON parse_cache (last_used)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per call, Streamlit sessions run on separate threads
+        return sqlite3.connect(self.path, timeout=5)
+
+    def get(self, key: str) -> list[dict] | None:
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT payload FROM parse_cache WHERE key = ?", (key,)
+                ).fetchone()
+
+                if row is None:
+                    return None
+
+                connection.execute(
+                    "UPDATE parse_cache SET last_used = ? WHERE key = ?", (time.time(), key)
+                )
+
+            return json.loads(row[0])
+
+        except Exception as error:
+            LOGGER.error(f'parse cache get error: {error}')
+            return None
+
+    def put(self, key: str, result: list[dict]):
+        try:
+            payload = json.dumps(result)
+
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO parse_cache (key, payload, size, last_used) VALUES (?, ?, ?, ?)",
+                    (key, payload, len(payload), time.time())
+                )
+                self._evict(connection)
+
+        except Exception as error:
+            LOGGER.error(f'parse cache put error: {error}')
+
+    def _evict(self, connection: sqlite3.Connection):
+        rows = connection.execute(
+            "SELECT key, size FROM parse_cache ORDER BY last_used DESC"
+        ).fetchall()
+
+        total = 0
+        stale_keys = []
+
+        for key, size in rows:
+            total += size
+
+            if total > self.max_bytes:
+                stale_keys.append((key,))
+
+        if stale_keys:
+            connection.executemany("DELETE FROM parse_cache WHERE key = ?", stale_keys)
+
+    def clear(self):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM parse_cache")
+
+
+def read_pdf_bytes(pdf_source: str | bytes | BinaryIO) -> bytes:
+    if isinstance(pdf_source, (bytes, bytearray, memoryview)):
+        return bytes(pdf_source)
+
+    if isinstance(pdf_source, (str, os.PathLike)):
+        with open(pdf_source, 'rb') as file:
+            return file.read()
+
+    if hasattr(pdf_source, 'getvalue'):
+        return pdf_source.getvalue()
+
+    return pdf_source.read()
+
+
+def get_cached_filings(cache: ParseCache, key: str, pdf_url: str) -> list[dict] | None:
+    """
+    Filings stored under key, None on a miss. Only the source URL is
+    refreshed since the same disclosure can be submitted under a different link.
+    """
+    cached = cache.get(key)
+
+    if cached is not None:
+        for filing in cached:
+            filing['source'] = pdf_url
+
+    return cached
+
+
+def iter_store_filings(filings: Iterator[dict], cache: ParseCache, key: str) -> Iterator[dict]:
+    """
+    Pass filings through, storing them under key only once every filing has
+    been yielded, so a parse that fails part way is never cached
+    """
+    result = []
+
+    for filing in filings:
+        # Stored as parsed, before the caller gets a chance to edit the filing
+        result.append(json.loads(json.dumps(filing)))
+        yield filing
+
+    cache.put(key, result)
+
+
+def iter_parse_with_cache(
+    pdf_source: str | bytes | BinaryIO,
+    pdf_url: str,
+    table_mode: str = TABLE_MODE_TEXT,
+    cache: ParseCache | None = None
+) -> Iterator[dict]:
+    """
+    iter_parser_new_document with a content addressed cache in front of it.
+    A hit skips parsing entirely, see get_cached_filings. A miss is only
+    stored once every filing has been yielded.
+    """
+    cache = cache or ParseCache()
+
+    pdf_bytes = read_pdf_bytes(pdf_source)
+    key = make_cache_key(pdf_bytes, table_mode)
+
+    cached = get_cached_filings(cache, key, pdf_url)
+
+    if cached is not None:
+        yield from cached
+        return
+
+    yield from iter_store_filings(iter_parser_new_document(pdf_bytes, pdf_url, table_mode), cache, key)
+
+
+def parse_with_cache(
+    pdf_source: str | bytes | BinaryIO,
+    pdf_url: str,
+    table_mode: str = TABLE_MODE_TEXT,
+    cache: ParseCache | None = None
+) -> list[dict]:
+    return list(iter_parse_with_cache(pdf_source, pdf_url, table_mode, cache))
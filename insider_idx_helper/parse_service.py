@@ -0,0 +1,342 @@
+"""
+Local parse service, a warm process pool behind a socket on this machine.
+
+Usage (from the repository root):
+    python -m insider_idx_helper.parse_service --workers 4
+
+The address and key come from PARSE_SERVICE_HOST, PARSE_SERVICE_PORT and
+PARSE_SERVICE_AUTHKEY, clients read the same variables. There is no default
+key, the service refuses to start without one. A caller submits a
+PDF and gets a job id back, polls it and fetches the filings once done.
+parse_batch parses many PDFs in one call for other pipelines.
+"""
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from multiprocessing.managers import BaseManager
+from typing import BinaryIO
+
+from insider_idx_helper.parser_idx_helper import COMPANIES_PATH, TABLE_MODE_TEXT
+from insider_idx_helper.batch_parser import create_parse_executor, submit_restarting
+from insider_idx_helper.parse_cache import ParseCache, get_cached_filings, make_cache_key, read_pdf_bytes
+from insider_idx_helper.report_segments import iter_report_filings, split_report_segments
+
+import argparse
+import logging
+import os
+import threading
+import time
+import uuid
+
+
+LOGGER = logging.getLogger(__name__)
+
+PARSE_SERVICE_ADDRESS = (
+    os.environ.get('PARSE_SERVICE_HOST', '127.0.0.1'),
+    int(os.environ.get('PARSE_SERVICE_PORT', '50917'))
+)
+
+DEFAULT_SERVICE_WORKERS = os.cpu_count() or 2
+
+# Finished jobs are kept this many seconds after submission, fetched or not
+JOB_TTL = 3600
+
+
+class ParseService:
+    """
+    Jobs live in this process, their parses in the pool. A PDF bundling
+    several reports is split here and every report runs as its own task, so
+    one job can use more than one worker.
+    """
+
+    def __init__(self, workers: int = DEFAULT_SERVICE_WORKERS, companies_path: str = COMPANIES_PATH):
+        self.workers = workers
+        self.companies_path = companies_path
+        self.executor = create_parse_executor(workers, companies_path)
+        self.cache = ParseCache()
+        self.jobs = {}
+        self.lock = threading.Lock()
+        # Connections are served on their own threads, so two submits can
+        # both find the pool broken
+        self.executor_lock = threading.Lock()
+
+    def warm_up(self):
+        """
+        Start every worker now rather than on the first request, the pool
+        initializer loads fitz and the company index in each of them
+        """
+        pids = {future.result() for future in [self.executor.submit(os.getpid) for _ in range(self.workers)]}
+        LOGGER.info(f'parse service: {len(pids)} workers ready')
+
+    def _restart_executor(self, failed: ProcessPoolExecutor):
+        with self.executor_lock:
+            if self.executor is not failed:
+                return
+
+            failed.shutdown(wait=False, cancel_futures=True)
+            self.executor = create_parse_executor(self.workers, self.companies_path)
+
+    def _submit_segment(self, source: bytes, pdf_url: str, table_mode: str) -> Future:
+        return submit_restarting(lambda: self.executor, self._restart_executor, source, pdf_url, table_mode)
+
+    def _evict(self):
+        expired = time.time() - JOB_TTL
+
+        for job_id, job in list(self.jobs.items()):
+            if job['submitted_at'] < expired and all(future.done() for future in job['futures']):
+                del self.jobs[job_id]
+
+    def submit(self, pdf_source: str | bytes, pdf_url: str, table_mode: str = TABLE_MODE_TEXT) -> str:
+        """
+        Job id of the parse. A PDF already in the parse cache is done at
+        once, without being split into reports.
+        """
+        pdf_bytes = read_pdf_bytes(pdf_source)
+        key = make_cache_key(pdf_bytes, table_mode)
+        cached = get_cached_filings(self.cache, key, pdf_url)
+
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            segments, futures = [], [future]
+
+        else:
+            segments, segment_sources = split_report_segments(pdf_bytes)
+            futures = [self._submit_segment(source, pdf_url, table_mode) for source in segment_sources]
+
+        job = {
+            'pdf_url': pdf_url,
+            'cache_key': key,
+            'segments': segments,
+            'futures': futures,
+            'submitted_at': time.time()
+        }
+        job_id = uuid.uuid4().hex
+
+        with self.lock:
+            self._evict()
+            self.jobs[job_id] = job
+
+        return job_id
+
+    def _job(self, job_id: str) -> dict:
+        with self.lock:
+            job = self.jobs.get(job_id)
+
+        if job is None:
+            raise KeyError(f'unknown parse job {job_id}')
+
+        return job
+
+    def poll(self, job_id: str) -> dict:
+        with self.lock:
+            job = self.jobs.get(job_id)
+
+        if job is None:
+            return {'status': 'unknown', 'reports': 0, 'reports_done': 0}
+
+        done = [future for future in job['futures'] if future.done()]
+        failed = any(future.exception() is not None for future in done)
+
+        if len(done) < len(job['futures']):
+            status = 'running'
+
+        else:
+            status = 'error' if failed else 'done'
+
+        return {'status': status, 'reports': len(job['futures']), 'reports_done': len(done)}
+
+    def result(self, job_id: str, timeout: float | None = None) -> list[dict]:
+        """
+        Filings of every report in page order. The job is kept until JOB_TTL,
+        so a caller interrupted mid fetch, e.g. by a Streamlit rerun, can
+        fetch it again. Raises what the parse raised for a single report,
+        the errors of all failed reports together for a bundle. A bundle
+        whose reports all parsed is cached whole on its first fetch.
+        """
+        job = self._job(job_id)
+
+        _, not_done = wait(job['futures'], timeout=timeout)
+
+        if not_done:
+            raise TimeoutError(f"parse job {job_id} not done after {timeout}s")
+
+        if len(job['futures']) == 1:
+            return job['futures'][0].result()
+
+        filings = list(iter_report_filings(job['segments'], job['futures'], job['pdf_url']))
+
+        if not job.get('cached'):
+            self.cache.put(job['cache_key'], filings)
+            job['cached'] = True
+
+        return filings
+
+    def submit_batch(self, pdf_sources: list[str | bytes], pdf_urls: list[str], table_mode: str = TABLE_MODE_TEXT) -> list[str]:
+        if len(pdf_urls) != len(pdf_sources):
+            raise ValueError('pdf_urls must match pdf_sources in length')
+
+        return [self.submit(source, pdf_url, table_mode) for source, pdf_url in zip(pdf_sources, pdf_urls)]
+
+    def parse_batch(
+        self,
+        pdf_sources: list[str | bytes],
+        pdf_urls: list[str],
+        table_mode: str = TABLE_MODE_TEXT,
+        timeout: float | None = None
+    ) -> dict:
+        """
+        Parse many PDFs and wait for all of them, same shape as parse_many:
+        results in input order, None and a message in errors for a failed one
+        """
+        if len(pdf_urls) != len(pdf_sources):
+            raise ValueError('pdf_urls must match pdf_sources in length')
+
+        job_ids = []
+        errors = {}
+
+        for index, (source, pdf_url) in enumerate(zip(pdf_sources, pdf_urls)):
+            try:
+                job_ids.append(self.submit(source, pdf_url, table_mode))
+
+            except Exception as error:
+                job_ids.append(None)
+                errors[index] = f'{type(error).__name__}: {error}'
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        results = []
+
+        for index, job_id in enumerate(job_ids):
+            if job_id is None:
+                results.append(None)
+                continue
+
+            try:
+                remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+                results.append(self.result(job_id, remaining))
+
+            except Exception as error:
+                results.append(None)
+                errors[index] = f'{type(error).__name__}: {error}'
+
+        return {
+            'results': results,
+            'errors': errors
+        }
+
+
+def get_service_authkey() -> bytes:
+    """
+    PARSE_SERVICE_AUTHKEY, ValueError when it is not set. Requests are
+    unpickled by the service, so whoever holds the key can run code in it.
+    """
+    authkey = os.environ.get('PARSE_SERVICE_AUTHKEY')
+
+    if not authkey:
+        raise ValueError('PARSE_SERVICE_AUTHKEY is not set')
+
+    return authkey.encode()
+
+
+class ParseServiceManager(BaseManager):
+    pass
+
+
+# The one service of this process, see serve
+SERVICE = None
+
+
+def get_service() -> ParseService:
+    return SERVICE
+
+
+def serve(
+    address: tuple[str, int] = PARSE_SERVICE_ADDRESS,
+    authkey: bytes | None = None,
+    workers: int = DEFAULT_SERVICE_WORKERS,
+    companies_path: str = COMPANIES_PATH
+):
+    global SERVICE
+
+    # Checked before the pool starts
+    authkey = authkey or get_service_authkey()
+
+    SERVICE = ParseService(workers, companies_path)
+    SERVICE.warm_up()
+
+    ParseServiceManager.register('parse_service', callable=get_service)
+    server = ParseServiceManager(address=address, authkey=authkey).get_server()
+
+    LOGGER.info(f'parse service listening on {address[0]}:{address[1]}')
+    server.serve_forever()
+
+
+# Client side, one connection per process shared by every session
+CLIENT = None
+CLIENT_LOCK = threading.Lock()
+
+
+def connect_parse_service(
+    address: tuple[str, int] = PARSE_SERVICE_ADDRESS,
+    authkey: bytes | None = None
+):
+    """
+    Proxy to the running service, its methods are ParseService's.
+    Raises ConnectionError when no service is listening or no key is set.
+    """
+    global CLIENT
+
+    with CLIENT_LOCK:
+        if CLIENT is None:
+            try:
+                authkey = authkey or get_service_authkey()
+
+            except ValueError as error:
+                raise ConnectionError(f'parse service unavailable: {error}') from error
+
+            ParseServiceManager.register('parse_service')
+
+            manager = ParseServiceManager(address=address, authkey=authkey)
+            manager.connect()
+
+            CLIENT = manager.parse_service()
+
+        return CLIENT
+
+
+def reset_parse_service_client():
+    global CLIENT
+
+    with CLIENT_LOCK:
+        CLIENT = None
+
+
+def submit_to_service(pdf_source: str | bytes | BinaryIO, pdf_url: str, table_mode: str = TABLE_MODE_TEXT) -> str:
+    """
+    Submit through the shared client, reconnecting once if the service was
+    restarted since the last call
+    """
+    pdf_bytes = read_pdf_bytes(pdf_source)
+
+    try:
+        return connect_parse_service().submit(pdf_bytes, pdf_url, table_mode)
+
+    except (ConnectionError, EOFError, BrokenPipeError):
+        reset_parse_service_client()
+        return connect_parse_service().submit(pdf_bytes, pdf_url, table_mode)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=DEFAULT_SERVICE_WORKERS)
+    parser.add_argument('--companies', default=COMPANIES_PATH)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if not os.environ.get('PARSE_SERVICE_AUTHKEY'):
+        parser.error('set PARSE_SERVICE_AUTHKEY to a random secret shared with the clients')
+
+    serve(workers=args.workers, companies_path=args.companies)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,36 +1,198 @@
+from array import array
+from bisect import bisect_right
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from typing import BinaryIO, Iterable, Iterator
 
 from insider_idx_helper.utils.helper import (
     classify_transaction_type, 
     map_transaction_type,
     clean_number, 
     clean_percentage,
-    standardize_date,
     clean_company_name,
     to_kebab, 
     pop_purpose
 )
+from insider_idx_helper.utils.date_format import normalize_dates
+from insider_idx_helper.utils.document_text import DocumentText, as_document_text
+from insider_idx_helper.utils.purpose_classifier import classify_purpose
+from insider_idx_helper.utils.stage_timer import StageTimer, emit_timings
+from utils.company_index import COMPANIES_PATH, CompanyIndex, get_company_index
 
 import fitz
 import re
 import logging 
-import json 
+import os
 
 
 LOGGER = logging.getLogger(__name__)
+
+# Bump whenever parsing or enrichment output changes, it invalidates cached parses
+PARSER_VERSION = '2'
+
+TRANSACTION_KEYWORDS = [
+    "Penjualan", "Pembelian", "Lainnya", 
+    "Koreksi", 'Pelaksanaan', '(exercise)', 'Hibah'
+]
+
+FOOTER_KEYWORDS = [
+    "Pemberi", "Keterangan", "Jika", 
+    "Nama pemegang", "Informasi", "Saya bertanggung", "Hak Suara"
+]
+
+# Line classes produced by classify_line
+LINE_DATA = 0
+LINE_FOOTER = 1
+LINE_TRANSACTION = 2
+LINE_HEADER = 3
+LINE_INDIRECT = 4   # "Tidak" / "Ya" answer of the indirect ownership column
+LINE_DIRECT = 5     # "Langsung" answer of the ownership status column
+LINE_DASH = 6       # "-" placeholder for an empty Harga cell
+LINE_DATE = 7       # first line of a transaction date, e.g. "12-Jan-"
+
+MARKER_CLASSES = (LINE_INDIRECT, LINE_DIRECT, LINE_FOOTER)
+CLASSIFICATION_STOP_CLASSES = (LINE_FOOTER, LINE_TRANSACTION, LINE_DASH)
+
+# How many lines extract_price_transaction looks ahead for each anchor
+START_LOOKAHEAD = 9
+NEXT_START_LOOKAHEAD = 10
+AMOUNT_LOOKAHEAD = 100
+CLASSIFICATION_LOOKAHEAD = 10
+PRICE_LOOKAHEAD = 10
+
+# Table extraction modes of extract_prices
+TABLE_MODE_TEXT = 'text'      # page text in reading order, rebuilt by extract_price_transaction
+TABLE_MODE_WORDS = 'words'    # word boxes placed into columns and rows by coordinates
+
+# First word of every column header, for the word box table mode
+WORD_HEADER_COLUMNS = {
+    'Jenis': 'type',
+    'Efek': 'indirect',
+    'Status': 'status',
+    'Jumlah': 'amount',
+    'Klasifikasi': 'classification',
+    'Harga': 'price',
+    'Tanggal': 'date',
+    'Tujuan': 'purpose'
+}
+REQUIRED_WORD_COLUMNS = ('type', 'amount', 'price', 'date', 'purpose')
+
+# "(exercise)" continues a "Pelaksanaan" cell, it never opens a row
+ROW_START_KEYWORDS = frozenset(keyword for keyword in TRANSACTION_KEYWORDS if keyword != '(exercise)')
+
+FOOTER_FIRST_WORDS = tuple(keyword.split()[0] for keyword in FOOTER_KEYWORDS)
+
+HEADER_BAND = 30      # points below "Jenis" where the other column headers may start
+WORD_TOLERANCE = 2    # points of slack on column edges and row tops
+
+# Footers match as prefixes, everything else must be the whole line
+LINE_CLASS_PATTERN = re.compile(
+    r"(?P<footer>(?:" + "|".join(map(re.escape, FOOTER_KEYWORDS)) + r"))"
+    r"|(?P<transaction>(?:" + "|".join(map(re.escape, TRANSACTION_KEYWORDS)) + r")\Z)"
+    r"|(?P<header>Jenis\Z)"
+    r"|(?P<indirect>(?:Tidak|Ya)\Z)"
+    r"|(?P<direct>Langsung\Z)"
+    r"|(?P<dash>-\Z)"
+    r"|(?P<date>\d{1,2}[\s-])"
+)
+
+DIGIT_PATTERN = re.compile(r'\d')
+
+TABLE_PRECHECK_PATTERN = re.compile(r'klasifikasi', re.IGNORECASE)
+TABLE_PAGE_KEYS = ['jenis transaksi', 'klasifikasi saham']
+
+# Every header field of the cover page in one alternation, the value group of
+# each field is named after it. The symbol/company field is case sensitive and
+# spans lines, the others ignore case. The lookahead on the first letter of
+# every label lets the scan skip most positions without trying the alternatives.
+HEADER_FIELDS_PATTERN = re.compile(
+    r"(?=[NnJjHh])(?:"
+    r"(?i:Nama \(sesuai SID\)\s*:\s*(?P<holder_name>.+?)(?:\n|$))"
+    r"|Nama Perusahaan Tbk\s*:\s*(?P<symbol>[A-Z]+)\s*-\s*(?P<company_name>(?s:.+?))(?=Tbk|PT|Jumlah Saham)"
+    r"|(?i:Jumlah Saham Sebelum Transaksi\s*:\s*(?P<holding_before>[\d\.,]+))"
+    r"|(?i:Jumlah Saham Setelah Transaksi\s*:\s*(?P<holding_after>[\d\.,]+))"
+    r"|(?i:Hak Suara Sebelum Transaksi\s*:\s*(?P<vote_before>[\d,]+)\s*%?)"
+    r"|(?i:Hak Suara Setelah Transaksi\s*:\s*(?P<vote_after>[\d,]+)\s*%?)"
+    r")"
+)
+# Seven fields plus the end offset of the company name
+HEADER_FIELD_COUNT = 8
+
+# Group that starts the value of each alternative, scanning resumes there
+HEADER_VALUE_GROUPS = {
+    'holder_name': 'holder_name',
+    'company_name': 'symbol',
+    'holding_before': 'holding_before',
+    'holding_after': 'holding_after',
+    'vote_before': 'vote_before',
+    'vote_after': 'vote_after'
+}
+
+PT_PATTERN = re.compile(r'\bPt\b')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Company name without a leading ticker, resolved through the trigram index
+COMPANY_NAME_FALLBACK_PATTERN = re.compile(r"Nama Perusahaan(?: Tbk)?\s*:\s*(.+)")
+FALLBACK_MIN_SCORE = 0.6
+
+LINE_CLASS_GROUPS = {
+    'footer': LINE_FOOTER,
+    'transaction': LINE_TRANSACTION,
+    'header': LINE_HEADER,
+    'indirect': LINE_INDIRECT,
+    'direct': LINE_DIRECT,
+    'dash': LINE_DASH,
+    'date': LINE_DATE
+}
+
+
+def classify_line(line: str) -> int:
+    match = LINE_CLASS_PATTERN.match(line)
+
+    if match is None:
+        return LINE_DATA
+
+    return LINE_CLASS_GROUPS[match.lastgroup]
+
+
+@lru_cache(maxsize=8)
+def scan_header_fields(text: str) -> dict[str, any]:
+    """
+    Raw header values of one page from a single left to right scan, keeping
+    the first occurrence of each field. Scanning resumes at the start of every
+    value rather than its end, so a label inside a long company name is still
+    found. Cached, since the shares and the payload stages read the same page.
+    """
+    fields = {}
+    match = HEADER_FIELDS_PATTERN.search(text)
+
+    while match is not None:
+        name = match.lastgroup
+
+        if name not in fields:
+            if name == 'company_name':
+                fields['symbol'] = match.group('symbol')
+                fields['company_end'] = match.end()
+
+            fields[name] = match.group(name)
+
+            if len(fields) == HEADER_FIELD_COUNT:
+                break
+
+        match = HEADER_FIELDS_PATTERN.search(text, match.start(HEADER_VALUE_GROUPS[name]))
+
+    return fields
     
 
 def extract_holder_name(text: str) -> str:
     try: 
-        holder_name_pattern = r"Nama \(sesuai SID\)\s*:\s*(.+?)(?:\n|$)"
-
-        holder_name = re.search(holder_name_pattern, text, re.IGNORECASE)
-        holder_name = holder_name.group(1) if holder_name else None 
+        holder_name = scan_header_fields(text).get('holder_name')
         
         if holder_name:
             holder_name = holder_name.title()
             # Convert any form of "pt" to "PT"
-            holder_name = re.sub(r'\bPt\b', 'PT', holder_name)
+            holder_name = PT_PATTERN.sub('PT', holder_name)
 
         return holder_name
     
@@ -42,19 +204,18 @@ def extract_holder_name(text: str) -> str:
 def extract_symbol_and_company_name(text: str) -> dict[str, str]:
     try: 
         # Company Name (with or without line breaks)
-        pattern1 = r"Nama Perusahaan Tbk\s*:\s*([A-Z]+)\s*-\s*(.+?)(?=Tbk|PT|Jumlah Saham)"
-        
-        match = re.search(pattern1, text, re.DOTALL)
+        fields = scan_header_fields(text)
         
-        if match:
-            symbol = match.group(1).strip()
-            company_name = match.group(2).strip()
+        if 'company_name' in fields:
+            symbol = fields['symbol'].strip()
+            company_name = fields['company_name'].strip()
+            company_end = fields['company_end']
             
             # Clean up company name: remove extra whitespace, newlines, and trailing commas
-            company_name = re.sub(r'\s+', ' ', company_name) 
+            company_name = WHITESPACE_PATTERN.sub(' ', company_name) 
             company_name = company_name.rstrip(',').strip()   
             
-            if 'Tbk' in text[match.end():match.end()+20]:
+            if 'Tbk' in text[company_end:company_end+20]:
                 company_name += ' Tbk'
             
             # LOGGER.info(f'Extracted symbol: {symbol}, company_name: {company_name}')
@@ -70,27 +231,42 @@ def extract_symbol_and_company_name(text: str) -> dict[str, str]:
         return None, None 
 
 
+def resolve_symbol_by_name(text: str, company_lookup: dict | CompanyIndex) -> tuple[str | None, str | None]:
+    """
+    Fallback when Nama Perusahaan is not in the "SYMBOL - Name" form, the text
+    after the label is fuzzy matched against the company index
+    """
+    if not isinstance(company_lookup, CompanyIndex):
+        return None, None
+
+    match = COMPANY_NAME_FALLBACK_PATTERN.search(text)
+
+    if not match:
+        return None, None
+
+    candidates = company_lookup.search(match.group(1), limit=1, min_score=FALLBACK_MIN_SCORE)
+
+    if not candidates:
+        LOGGER.info(f'no company match for: {match.group(1)}')
+        return None, None
+
+    return candidates[0]['symbol'], candidates[0]['company_name']
+
+
 def extract_shares(text: str) -> dict[str, any]: 
     try:
-        # Regex Patterns
-        shares_before = r"Jumlah Saham Sebelum Transaksi\s*:\s*([\d\.,]+)"
-        shares_after = r"Jumlah Saham Setelah Transaksi\s*:\s*([\d\.,]+)"
-        
-        # New Patterns for Voting Rights (handles optional % sign)
-        vote_before = r"Hak Suara Sebelum Transaksi\s*:\s*([\d,]+)\s*%?"
-        vote_after = r"Hak Suara Setelah Transaksi\s*:\s*([\d,]+)\s*%?"
+        fields = scan_header_fields(text)
 
-        # Search
-        shares_before = re.search(shares_before, text, re.IGNORECASE)
-        shares_after = re.search(shares_after, text, re.IGNORECASE)
-        vote_before = re.search(vote_before, text, re.IGNORECASE)
-        vote_after = re.search(vote_after, text, re.IGNORECASE)
+        shares_before = fields.get('holding_before')
+        shares_after = fields.get('holding_after')
+        vote_before = fields.get('vote_before')
+        vote_after = fields.get('vote_after')
 
         shares_payload = {
-            "holding_before": clean_number(shares_before.group(1)) if shares_before else None,
-            "holding_after": clean_number(shares_after.group(1)) if shares_after else None,
-            "share_percentage_before": clean_percentage(vote_before.group(1)) if vote_before else None,
-            "share_percentage_after": clean_percentage(vote_after.group(1)) if vote_after else None
+            "holding_before": clean_number(shares_before) if shares_before else None,
+            "holding_after": clean_number(shares_after) if shares_after else None,
+            "share_percentage_before": clean_percentage(vote_before) if vote_before else None,
+            "share_percentage_after": clean_percentage(vote_after) if vote_after else None
         }
 
         return shares_payload
@@ -100,14 +276,82 @@ def extract_shares(text: str) -> dict[str, any]:
         return {} 
 
 
-def extract_price_transaction(text: str) -> list[dict] | None:
+def has_decimal_number(line: str) -> bool:
+    return "," in line and DIGIT_PATTERN.search(line) is not None
+
+
+def tokenize_lines(text: str | Iterable[str]) -> tuple[list[str], bytearray, bytearray]:
+    """
+    Split text, or take a stream of raw lines, into stripped non-empty lines
+    and label each one exactly once.
+    Returns the lines, their LINE_* classes and a flag for lines holding a decimal number.
+    """
+    raw_lines = text.split('\n') if isinstance(text, str) else text
+    lines = [line for line in map(str.strip, raw_lines) if line]
+
+    line_classes = bytearray(
+        LINE_CLASS_GROUPS[match.lastgroup] if match else LINE_DATA
+        for match in map(LINE_CLASS_PATTERN.match, lines)
+    )
+    decimal_flags = bytearray(map(has_decimal_number, lines))
+
+    return lines, line_classes, decimal_flags
+
+
+def build_lookahead_tables(
+    lines: list[str], 
+    line_classes: bytearray, 
+    decimal_flags: bytearray
+) -> dict[str, list[int]]:
+    """
+    Answer every forward search of extract_price_transaction with one reverse pass.
+    Each table holds, per line, the index of the first line at or after it that is:
+    - marker: an ownership answer (Tidak/Ya/Langsung) or a footer
+    - amount: a "Saham" line directly below a decimal amount
+    - price: a decimal number or the "-" placeholder
+    Missing matches point past the last line. Indexes are packed in arrays,
+    a list would hold an int object per line.
+    """
+    total = len(lines)
+    # Two spare slots so callers can index up to total + 1
+    next_marker = array('q', [total]) * (total + 2)
+    next_amount = array('q', [total]) * (total + 2)
+    next_price = array('q', [total]) * (total + 2)
+
+    marker_idx = amount_idx = price_idx = total
+
+    for index in range(total - 1, -1, -1):
+        line_class = line_classes[index]
+
+        if line_class in MARKER_CLASSES:
+            marker_idx = index
+
+        if index > 0 and decimal_flags[index - 1] and lines[index] == "Saham":
+            amount_idx = index
+
+        if line_class == LINE_DASH or decimal_flags[index]:
+            price_idx = index
+
+        next_marker[index] = marker_idx
+        next_amount[index] = amount_idx
+        next_price[index] = price_idx
+
+    return {
+        'marker': next_marker,
+        'amount': next_amount,
+        'price': next_price
+    }
+
+
+def extract_price_transaction(text: str | Iterable[str]) -> list[dict] | None:
     try:
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines, line_classes, decimal_flags = tokenize_lines(text)
+        total = len(lines)
       
         # Header Detection
         header_start_idx = None
-        for index, line in enumerate(lines):
-            if line == "Jenis" and index + 1 < len(lines) and lines[index + 1] == "Transaksi":
+        for index in range(total - 1):
+            if line_classes[index] == LINE_HEADER and lines[index + 1] == "Transaksi":
                 header_start_idx = index
                 break
         
@@ -116,17 +360,16 @@ def extract_price_transaction(text: str) -> list[dict] | None:
         
         # Find Start of Data (After "Tujuan Transaksi")
         data_start_idx = None
-        for index in range(header_start_idx, len(lines) - 1):
+        for index in range(header_start_idx, total - 1):
             if lines[index] == "Tujuan" and lines[index + 1] == "Transaksi":
                 data_start_idx = index + 2
                 break
         
         # Fallback for data start
         if data_start_idx is None:
-             transaction_keywords = ["Penjualan", "Pembelian", "Lainnya", "Koreksi", 'Pelaksanaan', '(exercise)']
-             for index in range(header_start_idx, len(lines)):
-                 if lines[index] in transaction_keywords:
-                     if lines[index] == "Pelaksanaan" and index + 1 < len(lines) and lines[index+1] in ["Jumlah", "Saham"]:
+             for index in range(header_start_idx, total):
+                 if line_classes[index] == LINE_TRANSACTION:
+                     if lines[index] == "Pelaksanaan" and index + 1 < total and lines[index+1] in ["Jumlah", "Saham"]:
                          continue 
                      data_start_idx = index
                      break
@@ -134,248 +377,171 @@ def extract_price_transaction(text: str) -> list[dict] | None:
         if data_start_idx is None:
             return None
 
-        # Parse Transactions
+        tables = build_lookahead_tables(lines, line_classes, decimal_flags)
+        next_marker = tables['marker']
+        next_amount = tables['amount']
+        next_price = tables['price']
+
+        def is_real_start(start_idx: int, window: int) -> bool:
+            # A real transaction is followed by "Tidak", "Ya" or "Langsung" before any footer
+            marker_idx = next_marker[start_idx + 1]
+            return marker_idx <= start_idx + window and marker_idx < total and line_classes[marker_idx] != LINE_FOOTER
+
+        # Parse Transactions, every line is visited once going forward
         transactions = []
         index = data_start_idx
-        
-        transaction_keywords = [
-            "Penjualan", "Pembelian", "Lainnya", 
-            "Koreksi", 'Pelaksanaan', '(exercise)', 'Hibah'
-        ]
-
-        footer_keywords = [
-            "Pemberi", "Keterangan", "Jika", 
-            "Nama pemegang", "Informasi", "Saya bertanggung", "Hak Suara"
-        ]
 
-        while index < len(lines):
+        while index < total:
             line = lines[index]
+            line_class = line_classes[index]
             
             # If we hit a footer line, stop everything
-            if any(line.startswith(k) for k in footer_keywords):
+            if line_class == LINE_FOOTER:
                 break
             
             # Skip table headers
-            if line == "Jenis" and index + 1 < len(lines) and lines[index + 1] == "Transaksi":
-                while index < len(lines):
-                    if lines[index] == "Tujuan" and index + 1 < len(lines) and lines[index + 1] == "Transaksi":
+            if line_class == LINE_HEADER and index + 1 < total and lines[index + 1] == "Transaksi":
+                while index < total:
+                    if lines[index] == "Tujuan" and index + 1 < total and lines[index + 1] == "Transaksi":
                         index += 2
                         break
                     index += 1
                 continue
             
-            if line in transaction_keywords:
-                # A real transaction typically followed by "Tidak", "Ya", or "Langsung" 
-                # before hitting a footer
-                is_real_start = False
-                # Look ahead 10 lines
-                for i in range(1, 10): 
-                    if index + i >= len(lines): break
-                    val = lines[index + i]
-                    if val in ["Tidak", "Ya", "Langsung"]:
-                        is_real_start = True
-                        break
-                    if any(val.startswith(fk) for fk in footer_keywords):
-                        break 
-                
-                # If it's not a real start (e.g., it's just the word "Penjualan" in the purpose),
-                # skip this block and let the 'else' handle it or the previous purpose loop consume it
-                if not is_real_start:
-                    index += 1
-                    continue
-
-                # Parse Transaction Type 
-                type_parts = [line]
+            if line_class != LINE_TRANSACTION:
                 index += 1
-                while index < len(lines):
-                    curr = lines[index]
-                    if curr in ["Tidak", "Ya"]:
-                        break
-                    if curr == "Jenis" or any(curr.startswith(k) for k in footer_keywords): 
-                        break
-                    type_parts.append(curr)
-                    index += 1
-                
-                transaction_type = ' '.join(type_parts)
-                
-                if index < len(lines) and lines[index] in ["Tidak", "Ya"]: 
-                    index += 1
-
-                if index < len(lines) and lines[index] == "Langsung": 
-                    index += 1
-
-                # Find Amount (Anchor to "Saham" with validation)
-                scan_limit = min(index + 100, len(lines))
-                saham_found = False
-
-                for saham_idx in range(index, scan_limit):
-                    if lines[saham_idx] == "Saham":
-                        if saham_idx > 0:
-                            prev_line = lines[saham_idx - 1]
-                            
-                            if "," in prev_line and any(char.isdigit() for char in prev_line):
-                                index = saham_idx - 1
-                                saham_found = True
-                                break
-
-                if not saham_found:
-                    index += 1
-                    continue
+                continue
 
-                amount = lines[index] if index < len(lines) else None
+            # If it's not a real start (e.g., it's just the word "Penjualan" in the purpose), skip it
+            if not is_real_start(index, START_LOOKAHEAD):
                 index += 1
+                continue
 
-                if index < len(lines) and lines[index] == "Saham":
-                    index += 1
-
-                # Collect Klasifikasi Saham
-                classification_parts = ["Saham"]
-                klasifikasi_scan_limit = min(index + 10, len(lines))
-
-                for klasifikasi_idx in range(index, klasifikasi_scan_limit):
-                    current_line = lines[klasifikasi_idx]
+            # Parse Transaction Type 
+            type_parts = [line]
+            index += 1
+            while index < total and line_classes[index] not in (LINE_INDIRECT, LINE_HEADER, LINE_FOOTER):
+                type_parts.append(lines[index])
+                index += 1
+            
+            transaction_type = ' '.join(type_parts)
+            
+            if index < total and line_classes[index] == LINE_INDIRECT: 
+                index += 1
 
-                    if "," in current_line and any(char.isdigit() for char in current_line):
-                        index = klasifikasi_idx
-                        break
+            if index < total and line_classes[index] == LINE_DIRECT: 
+                index += 1
 
-                    if any(current_line.startswith(footer_keyword) for footer_keyword in footer_keywords):
-                        index = klasifikasi_idx
-                        break
+            # Find Amount (Anchor to "Saham" with validation)
+            saham_idx = next_amount[index]
 
-                    if current_line in transaction_keywords:
-                        index = klasifikasi_idx
-                        break
+            if saham_idx >= min(index + AMOUNT_LOOKAHEAD, total):
+                index += 1
+                continue
 
-                    # A bare dash is the null placeholder for Harga, never part of Klasifikasi Saham
-                    if current_line == "-":
-                        index = klasifikasi_idx
-                        break
+            index = saham_idx - 1
+            amount = lines[index]
+            index += 1
 
-                    classification_parts.append(current_line)
-                else:
-                    index = klasifikasi_scan_limit
+            if index < total and lines[index] == "Saham":
+                index += 1
 
-                classification_saham = " ".join(classification_parts)
+            # Collect Klasifikasi Saham
+            classification_parts = ["Saham"]
+            klasifikasi_scan_limit = min(index + CLASSIFICATION_LOOKAHEAD, total)
 
-                # Find Price
-                scan_limit_price = min(index + 10, len(lines))
-                price = None
-                price_found = False
+            while index < klasifikasi_scan_limit:
+                # A bare dash is the null placeholder for Harga, never part of Klasifikasi Saham
+                if decimal_flags[index] or line_classes[index] in CLASSIFICATION_STOP_CLASSES:
+                    break
 
-                for price_idx in range(index, scan_limit_price):
-                    candidate = lines[price_idx]
+                classification_parts.append(lines[index])
+                index += 1
 
-                    if candidate == "-":
-                        price = None
-                        price_found = True
-                        index = price_idx + 1
-                        break
+            classification_saham = " ".join(classification_parts)
 
-                    if "," in candidate and any(char.isdigit() for char in candidate):
-                        price = candidate
-                        price_found = True
-                        index = price_idx + 1
-                        break
+            # Find Price
+            price_idx = next_price[index]
 
-                if not price_found:
-                    price = lines[index] if index < len(lines) else None
+            if price_idx < min(index + PRICE_LOOKAHEAD, total):
+                price = None if line_classes[price_idx] == LINE_DASH else lines[price_idx]
+                index = price_idx + 1
+            else:
+                price = lines[index] if index < total else None
+                index += 1
+            
+            # Find Date
+            date_parts = []
+            while index < total:
+                # Check if this line starts a date
+                if line_classes[index] == LINE_DATE:
+                    date_parts.append(lines[index])
                     index += 1
-                
-                # Find Date
-                date_parts = []
-                while index < len(lines):
-                    part = lines[index]
-                    # Check if this line starts a date
-                    if re.match(r'^\d{1,2}[\s-]', part):
+
+                    # Collect remaining date parts
+                    while index < total:
+                        part = lines[index]
                         date_parts.append(part)
                         index += 1
+                        
+                        if part.isdigit() and len(part) == 4: 
+                            break
+                        if len(date_parts) >= 5: 
+                            break
+                    break
 
-                        # Collect remaining date parts
-                        while index < len(lines):
-                            part = lines[index]
-                            date_parts.append(part)
-                            index += 1
-                            
-                            if part.isdigit() and len(part) == 4: 
-                                break
-                            if len(date_parts) >= 5: 
-                                break
-                        break
-
-                    index += 1
-                    if len(date_parts) > 0 or index >= min(len(lines), index + 10):
-                        break
+                index += 1
 
-                date = ' '.join(date_parts) if date_parts else None
+            date = ' '.join(date_parts) if date_parts else None
+            
+            # Find Purpose (runs until a footer, a table header or the next real transaction)
+            purpose_parts = []
+            while index < total:
+                curr_class = line_classes[index]
                 
-                # Find Purpose (always exactly one line after date)
-                purpose_parts = []
-                while index < len(lines):
-                    curr = lines[index]
-                    
-                    # Stop if footer
-                    if any(curr.startswith(k) for k in footer_keywords): 
-                        break
-                    
-                    # Stop if table header
-                    if curr == "Jenis" and index + 1 < len(lines) and lines[index + 1] == "Transaksi":
-                        break
-
-                    # Check if NEXT line is start of new transaction (look ahead)
-                    if index + 1 < len(lines) and lines[index + 1] in transaction_keywords:
-                        # Verify next line is real transaction start
-                        is_next_real_start = False
-                        for i in range(2, 12):  # Look from index+2 onwards
-                            if index + i >= len(lines): break
-                            val = lines[index + i]
-                            if val in ["Tidak", "Ya", "Langsung"]:
-                                is_next_real_start = True
-                                break
-                            if any(val.startswith(fk) for fk in footer_keywords):
-                                break
-                        
-                        if is_next_real_start:
-                            # Next line starts new transaction, current line is last part of purpose
-                            purpose_parts.append(curr)
-                            index += 1
-                            break
-                    
-                    # Current line is part of purpose
-                    purpose_parts.append(curr)
-                    index += 1
+                # Stop if footer
+                if curr_class == LINE_FOOTER: 
+                    break
+                
+                # Stop if table header
+                if curr_class == LINE_HEADER and index + 1 < total and lines[index + 1] == "Transaksi":
+                    break
 
-                purpose = ' '.join(purpose_parts)
+                purpose_parts.append(lines[index])
+                index += 1
 
-                LOGGER.info(
-                    f"DEBUG: transaction_type='{transaction_type}', amount={amount}, price={price}, date={date}"
-                )
+                # Next line starts new transaction, current line is last part of purpose
+                if index < total and line_classes[index] == LINE_TRANSACTION and is_real_start(index, NEXT_START_LOOKAHEAD):
+                    break
 
-                # Build Object
-                # print(f'raw tx type: {transaction_type} | purpose: {purpose}')
+            purpose = ' '.join(purpose_parts)
 
-                type_mapped = map_transaction_type(transaction_type)
-                amount_clean = clean_number(amount) 
-                price_clean = clean_number(price) 
-                date_clean = standardize_date(date) 
+            LOGGER.info(
+                f"DEBUG: transaction_type='{transaction_type}', amount={amount}, price={price}, date={date}"
+            )
 
-                transaction = {
-                    "type": type_mapped,
-                    "amount_transacted": amount_clean,
-                    "price": price_clean,
-                    "date": date_clean,
-                    "purpose": purpose,
-                    "classification": classification_saham
-                }
+            type_mapped = map_transaction_type(transaction_type)
+            amount_clean = clean_number(amount) 
+            price_clean = clean_number(price) 
 
-                transactions.append(transaction)
+            transaction = {
+                "type": type_mapped,
+                "amount_transacted": amount_clean,
+                "price": price_clean,
+                "date": date,
+                "purpose": purpose,
+                "classification": classification_saham
+            }
 
-            else:
-                index += 1
+            transactions.append(transaction)
       
         if not transactions:
             return None
 
+        # The whole date column at once, repeated dates are normalized once
+        for transaction, date_clean in zip(transactions, normalize_dates([transaction["date"] for transaction in transactions])):
+            transaction["date"] = date_clean
+
         return transactions 
     
     except Exception as error:
@@ -383,6 +549,130 @@ def extract_price_transaction(text: str) -> list[dict] | None:
         return None
     
 
+def locate_word_columns(words: list[tuple]) -> tuple[float, dict[str, float]] | None:
+    """
+    Find the transaction table header among a page's word boxes.
+    Returns the top of the header and the left edge of every column found.
+    """
+    for word in words:
+        if word[4] != 'Jenis':
+            continue
+
+        header_top = word[1]
+
+        # "Jenis" must sit directly above "Transaksi" in the same column
+        has_transaksi = any(
+            other[4] == 'Transaksi' 
+            and abs(other[0] - word[0]) <= WORD_TOLERANCE 
+            and 0 < other[1] - header_top <= HEADER_BAND
+            for other in words
+        )
+
+        if not has_transaksi:
+            continue
+
+        columns = {}
+        for other in words:
+            if not header_top - WORD_TOLERANCE <= other[1] <= header_top + HEADER_BAND:
+                continue
+
+            column = WORD_HEADER_COLUMNS.get(other[4])
+            if column and column not in columns:
+                columns[column] = other[0]
+
+        if all(column in columns for column in REQUIRED_WORD_COLUMNS):
+            return header_top, columns
+
+    return None
+
+
+def extract_word_table_transactions(words: list[tuple]) -> list[dict]:
+    """
+    Rebuild the transaction table of one page from fitz word boxes.
+    Words go to a column by x coordinate and to a row by y band, rows start
+    at a transaction keyword in the Jenis Transaksi column and the table ends
+    at the first footer line left of the Jumlah Saham column.
+    """
+    located = locate_word_columns(words)
+
+    if located is None:
+        return []
+
+    header_top, columns = located
+
+    edges = sorted((x - WORD_TOLERANCE, column) for column, x in columns.items())
+    edge_x = [x for x, _ in edges]
+    edge_columns = [column for _, column in edges]
+    type_position = edge_columns.index('type')
+    amount_position = edge_columns.index('amount')
+
+    # Reading order: by line bottom, then left to right
+    body = sorted(
+        (word for word in words if word[1] > header_top + WORD_TOLERANCE),
+        key=itemgetter(3, 0)
+    )
+    positions = [bisect_right(edge_x, word[0]) - 1 for word in body]
+
+    row_tops = []
+    footer_lines = defaultdict(list)
+
+    for word, position in zip(body, positions):
+        if position == type_position and word[4] in ROW_START_KEYWORDS:
+            row_tops.append(word[1] - WORD_TOLERANCE)
+
+        if position < amount_position:
+            footer_lines[(word[5], word[6])].append(word)
+
+    if not row_tops:
+        return []
+
+    row_tops.sort()
+
+    table_bottom = float('inf')
+    for line_words in footer_lines.values():
+        line_top = line_words[0][1]
+
+        if line_top <= row_tops[0] or not line_words[0][4].startswith(FOOTER_FIRST_WORDS):
+            continue
+
+        if classify_line(' '.join(word[4] for word in line_words)) == LINE_FOOTER:
+            table_bottom = min(table_bottom, line_top - WORD_TOLERANCE)
+
+    row_tops = [top for top in row_tops if top < table_bottom]
+    rows = [defaultdict(list) for _ in row_tops]
+
+    for word, position in zip(body, positions):
+        if position < 0 or not row_tops[0] <= word[1] < table_bottom:
+            continue
+
+        rows[bisect_right(row_tops, word[1]) - 1][edge_columns[position]].append(word[4])
+
+    transactions = []
+    for cells in rows:
+        amount = ' '.join(cells['amount'])
+
+        # Same rule as the text path, a row without an amount is not a transaction
+        if not amount:
+            continue
+
+        price = ' '.join(cells['price'])
+        date = ' '.join(cells['date'])
+
+        transactions.append({
+            "type": map_transaction_type(' '.join(cells['type'])),
+            "amount_transacted": clean_number(amount),
+            "price": clean_number(price) if price != '-' else None,
+            "date": date or None,
+            "purpose": ' '.join(cells['purpose']),
+            "classification": ' '.join(cells['classification']) or "Saham"
+        })
+
+    for transaction, date_clean in zip(transactions, normalize_dates([transaction["date"] for transaction in transactions])):
+        transaction["date"] = date_clean
+
+    return transactions
+
+
 def build_lookup_price_transaction(transactions: list[dict[str, any]]):
     try: 
         transaction_lookup = defaultdict(list)
@@ -509,17 +799,37 @@ def enrich_transaction(extracted_data: dict[str, any], filing_type: str = 'split
         return {}
     
 
-def detect_transaction_tables(doc) -> dict:
-    keys = ['jenis transaksi', 'klasifikasi saham']
+def is_transaction_table_page(document_text: DocumentText, page_num: int) -> bool:
+    # Cheap check on the raw text before normalizing the whole page
+    if TABLE_PRECHECK_PATTERN.search(document_text.text(page_num)) is None:
+        return False
+
+    # Lowercased, whitespace normalized text, dropped once checked
+    text = document_text.normalized(page_num)
+    document_text.release_normalized(page_num)
+
+    return all(key in text for key in TABLE_PAGE_KEYS)
+
+
+def detect_transaction_tables(doc: fitz.Document | DocumentText) -> dict:
+    """
+    Find the contiguous block of pages holding the transaction table.
+    Scanning stops at the first page after the block, so trailing signature
+    and annex pages are never read.
+    """
+    document_text = as_document_text(doc)
     pages_with_tables = []
     
-    for page_num, page in enumerate(doc, start=0):
-        text = page.get_text().lower()
-        # Normalize all whitespace to single spaces
-        text = re.sub(r'\s+', ' ', text)
-        
-        if all(key in text for key in keys):
+    for page_num in range(len(document_text)):
+        if is_transaction_table_page(document_text, page_num):
             pages_with_tables.append(page_num)
+            continue
+
+        # Rejected pages are never read again
+        document_text.release(page_num)
+
+        if pages_with_tables:
+            break
     
     return {
         'count': len(pages_with_tables),
@@ -527,14 +837,15 @@ def detect_transaction_tables(doc) -> dict:
     }
 
 
-def collect_extract_shares(doc: fitz.Document, pdf_url: str) -> dict | None:
+def collect_extract_shares(doc: fitz.Document | DocumentText, pdf_url: str) -> dict | None:
+    document_text = as_document_text(doc)
     extracted_data = {}
 
     for page_index in [0, 1]:
-        if page_index >= len(doc):
+        if page_index >= len(document_text):
             break
 
-        text = doc[page_index].get_text()
+        text = document_text.text(page_index)
         shares_data = extract_shares(text)
 
         for key, value in shares_data.items():
@@ -561,16 +872,19 @@ def collect_extract_shares(doc: fitz.Document, pdf_url: str) -> dict | None:
 
 
 def enrich_payload(
-    doc: fitz.Document,
+    doc: fitz.Document | DocumentText,
     extracted_data: dict,
-    company_lookup: dict,
+    company_lookup: dict | CompanyIndex,
     pdf_url: str
 ) -> None:
-    text = doc[0].get_text()
+    text = as_document_text(doc).text(0)
 
     holder_name = extract_holder_name(text)
     symbol, company_name = extract_symbol_and_company_name(text)
 
+    if symbol is None:
+        symbol, company_name = resolve_symbol_by_name(text, company_lookup)
+
     if company_lookup and symbol:
         company_entry = company_lookup.get(symbol)
 
@@ -588,82 +902,199 @@ def enrich_payload(
     extracted_data['sub_sector'] = to_kebab(sub_sector)
 
 
-def extract_prices(doc: fitz.Document):
-    detected_pages = detect_transaction_tables(doc=doc)
+def extract_prices(
+    doc: fitz.Document | DocumentText,
+    table_mode: str = TABLE_MODE_TEXT,
+    timer: StageTimer | None = None
+):
+    timer = timer or StageTimer()
+    document_text = as_document_text(doc)
+
+    with timer.stage('detect_transaction_tables'):
+        detected_pages = detect_transaction_tables(doc=document_text)
+
     pages_index = detected_pages.get('pages')
 
-    full_text_lines = [
-        doc[page_index].get_text()
-        for page_index in range(pages_index[0], pages_index[-1] + 1)
-    ]
-    combined_text = "\n".join(full_text_lines)
+    if table_mode == TABLE_MODE_WORDS:
+        price_transactions = []
+
+        with timer.stage('extract_word_table_transactions'):
+            for page_index in range(pages_index[0], pages_index[-1] + 1):
+                price_transactions.extend(
+                    extract_word_table_transactions(document_text.words(page_index))
+                )
+                document_text.release(page_index)
+
+        return price_transactions or None
+
+    if table_mode != TABLE_MODE_TEXT:
+        raise ValueError(f'Unknown table mode: {table_mode}')
+
+    with timer.stage('extract_price_transaction'):
+        # Streamed page by page, the table text is never joined into one string
+        table_lines = document_text.iter_lines(pages_index[0], pages_index[-1] + 1)
 
-    price_transactions =  extract_price_transaction(combined_text)
+        price_transactions =  extract_price_transaction(table_lines)
 
     return price_transactions
 
 
-def parse_document(
-    doc: fitz.Document,
+def iter_parse_document(
+    doc: fitz.Document | DocumentText,
     pdf_url: str,
-    company_lookup: dict,
-) -> list[dict]:
-    extracted_data = collect_extract_shares(doc, pdf_url)
+    company_lookup: dict | CompanyIndex,
+    table_mode: str = TABLE_MODE_TEXT,
+    timer: StageTimer | None = None
+) -> Iterator[dict]:
+    """
+    Yield one filing per transaction type as soon as it is enriched.
+    Shares, holder and company are read once and shared by every filing.
+    A type can come back further down the table, so groups are only closed
+    once the table has been read.
+    """
+    timer = timer or StageTimer(pdf_url)
+
+    # Every stage reads page text through the same cache, the page layouts
+    # are only worth keeping when the word boxes will be read
+    document_text = as_document_text(doc, keep_layout=table_mode == TABLE_MODE_WORDS)
+
+    with timer.stage('collect_extract_shares'):
+        extracted_data = collect_extract_shares(document_text, pdf_url)
 
     if extracted_data is None:
-        return []
-
-    enrich_payload(
-        doc, 
-        extracted_data, 
-        company_lookup,
-        pdf_url
-    )
+        return
+
+    with timer.stage('enrich_payload'):
+        enrich_payload(
+            document_text, 
+            extracted_data, 
+            company_lookup,
+            pdf_url
+        )
 
-    price_transactions = extract_prices(doc)
+    price_transactions = extract_prices(document_text, table_mode, timer)
 
     combined_filing = {**extracted_data, 'price_transaction': price_transactions}
-    enrich_transaction(combined_filing, 'combine')
+
+    with timer.stage('enrich_transaction'):
+        enrich_transaction(combined_filing, 'combine')
 
     price_data_list = build_lookup_price_transaction(price_transactions)
 
-    results = []
     for _, transactions in price_data_list.items():
         purpose = transactions[0].get('purpose') if transactions else None
         pop_purpose(transactions)
 
-        filing = {**extracted_data, 'price_transaction': transactions, 'purpose': purpose}
-        enrich_transaction(filing, 'split')
+        filing = {
+            **extracted_data,
+            'price_transaction': transactions,
+            'purpose': purpose,
+            'purpose_tags': list(classify_purpose(purpose))
+        }
 
-        results.append(filing)
+        with timer.stage('enrich_transaction'):
+            enrich_transaction(filing, 'split')
 
-    return results
+        yield filing
 
 
-def parser_new_document(
-    pdf_local_path: str,
+def parse_document(
+    doc: fitz.Document | DocumentText,
     pdf_url: str,
+    company_lookup: dict | CompanyIndex,
+    table_mode: str = TABLE_MODE_TEXT,
+    timer: StageTimer | None = None
 ) -> list[dict]:
-    doc = fitz.open(pdf_local_path)
-    
-    companies = 'data/companies.json'
+    """
+    Pass a StageTimer to get the time spent in each stage of this document
+    """
+    return list(iter_parse_document(doc, pdf_url, company_lookup, table_mode, timer))
+
+
+def load_company_lookup(companies_path: str = COMPANIES_PATH) -> CompanyIndex:
+    # Decoded once per process, every later call reuses the same index
+    return get_company_index(companies_path)
+
+
+def open_pdf(pdf_source: str | os.PathLike | bytes | bytearray | memoryview | BinaryIO) -> fitz.Document:
+    """
+    Open a PDF from a local path, or straight from memory (bytes, a buffer or a
+    file-like object such as a Streamlit upload) without writing it to disk
+    """
+    if isinstance(pdf_source, (str, os.PathLike)):
+        return fitz.open(pdf_source)
+
+    # BytesIO based uploads hand out their underlying bytes without a copy
+    if hasattr(pdf_source, 'getvalue'):
+        pdf_source = pdf_source.getvalue()
+
+    elif hasattr(pdf_source, 'read'):
+        pdf_source = pdf_source.read()
+
+    return fitz.open(stream=pdf_source, filetype='pdf')
+
+
+def iter_parser_new_document(
+    pdf_source: str | os.PathLike | bytes | bytearray | memoryview | BinaryIO | fitz.Document | DocumentText,
+    pdf_url: str,
+    table_mode: str = TABLE_MODE_TEXT,
+    timer: StageTimer | None = None
+) -> Iterator[dict]:
+    """
+    Stage timings go to the configured timing sink, including for a document
+    that fails part way, pass a timer to read them back as well.
+    A PDF opened here stays open until the generator is exhausted or closed,
+    an open document is parsed as is, along with the page text it already
+    read, and left open for the caller.
+    """
+    timer = timer or StageTimer(pdf_url)
+    is_open = isinstance(pdf_source, (fitz.Document, DocumentText))
 
-    with open(companies, 'r') as file: 
-        company_lookup = json.load(file)
-    
     try:
-        result = parse_document(
-            doc, 
-            pdf_url, 
-            company_lookup
-        )
+        if is_open:
+            doc = pdf_source
 
-    finally:
-        doc.close()
+        else:
+            with timer.stage('open_pdf'):
+                doc = open_pdf(pdf_source)
+    
+        company_lookup = load_company_lookup()
+    
+        try:
+            yield from iter_parse_document(
+                doc, 
+                pdf_url, 
+                company_lookup,
+                table_mode,
+                timer
+            )
+
+        finally:
+            if not is_open:
+                doc.close()
 
-    return result
+    finally:
+        emit_timings(timer.report())
 
 
+def parser_new_document(
+    pdf_source: str | os.PathLike | bytes | bytearray | memoryview | BinaryIO,
+    pdf_url: str,
+    table_mode: str = TABLE_MODE_TEXT,
+    timer: StageTimer | None = None
+) -> list[dict]:
+    return list(iter_parser_new_document(pdf_source, pdf_url, table_mode, timer))
 
 
+def parse_with_timings(
+    pdf_source: str | os.PathLike | bytes | bytearray | memoryview | BinaryIO,
+    pdf_url: str,
+    table_mode: str = TABLE_MODE_TEXT
+) -> dict:
+    timer = StageTimer(pdf_url)
+    results = parser_new_document(pdf_source, pdf_url, table_mode, timer)
 
+    return {
+        'results': results,
+        'timings': timer.report()
+    }
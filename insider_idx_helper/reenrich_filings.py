@@ -0,0 +1,341 @@
+"""
+Recompute the derived transaction fields of stored idx_filings rows.
+
+Usage (from the repository root):
+    python -m insider_idx_helper.reenrich_filings --report report.json
+    python -m insider_idx_helper.reenrich_filings --apply
+    python -m insider_idx_helper.reenrich_filings --sqlite local.sqlite3 --apply
+
+Without --apply nothing is written, the report lists every change the job
+would make. Supabase credentials are read from SUPABASE_URL and SUPABASE_KEY.
+"""
+from typing import Iterator, Protocol
+
+from insider_idx_helper.parser_idx_helper import enrich_transaction
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+
+
+LOGGER = logging.getLogger(__name__)
+
+FILINGS_TABLE = 'idx_filings'
+
+# Stored columns owned by enrich_transaction
+DERIVED_FIELDS = ['price', 'transaction_value', 'transaction_type', 'amount_transaction']
+
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_CHUNK_SIZE = 100
+
+
+class FilingStore(Protocol):
+    def fetch_page(self, after_id, limit: int) -> list[dict]:
+        ...
+
+    def update_many(self, updates: list[dict]) -> list:
+        """
+        Write the fields of each update to the row with its id, leaving
+        every other column as it is. Returns the ids that failed.
+        """
+        ...
+
+
+class SupabaseFilingStore:
+    def __init__(self, client, table: str = FILINGS_TABLE):
+        self.client = client
+        self.table = table
+
+    def fetch_page(self, after_id, limit: int) -> list[dict]:
+        query = self.client.table(self.table).select('*').order('id').limit(limit)
+
+        if after_id is not None:
+            query = query.gt('id', after_id)
+
+        return query.execute().data or []
+
+    def update_many(self, updates: list[dict]) -> list:
+        # One update per row, an upsert of partial rows fails the NOT NULL
+        # check before the conflict check and one of whole rows would
+        # revert edits made since the row was fetched
+        failed_ids = []
+
+        for update in updates:
+            fields = {field: value for field, value in update.items() if field != 'id'}
+
+            try:
+                self.client.table(self.table).update(fields).eq('id', update['id']).execute()
+
+            except Exception as error:
+                LOGGER.error(f"reenrich update error id {update['id']}: {error}")
+                failed_ids.append(update['id'])
+
+        return failed_ids
+
+
+class SqliteFilingStore:
+    """
+    Local stand-in for the filings table, one JSON row per id.
+    Lets the job run end to end against a copy of production rows.
+    """
+
+    def __init__(self, path: str, table: str = FILINGS_TABLE):
+        self.path = path
+        self.table = table
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} (id INTEGER PRIMARY KEY, payload TEXT NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5)
+
+    def fetch_page(self, after_id, limit: int) -> list[dict]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT payload FROM {self.table} WHERE id > ? ORDER BY id LIMIT ?",
+                (after_id if after_id is not None else -1, limit)
+            ).fetchall()
+
+        return [json.loads(payload) for payload, in rows]
+
+    def update_many(self, updates: list[dict]) -> list:
+        # json_set inside the UPDATE, so the rest of the stored row is never rewritten
+        with self._connect() as connection:
+            for update in updates:
+                fields = {field: value for field, value in update.items() if field != 'id'}
+                paths = ', '.join(f"'$.{field}', json(?)" for field in fields)
+
+                connection.execute(
+                    f"UPDATE {self.table} SET payload = json_set(payload, {paths}) WHERE id = ?",
+                    [*map(json.dumps, fields.values()), update['id']]
+                )
+
+        return []
+
+
+def iter_pages(store: FilingStore, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[list[dict]]:
+    """
+    Keyset pagination on id, a page never depends on how many rows came before
+    it, so rows written back while the job runs do not shift later pages
+    """
+    after_id = None
+
+    while True:
+        page = store.fetch_page(after_id, page_size)
+
+        if not page:
+            return
+
+        yield page
+
+        if len(page) < page_size:
+            return
+
+        after_id = page[-1]['id']
+
+
+def normalize_field(field: str, value):
+    """
+    Comparable form of a stored or recomputed value, numeric columns can come
+    back from the database as strings
+    """
+    if value is None:
+        return None
+
+    try:
+        if field == 'price':
+            return round(float(value), 3)
+
+        if field in ('transaction_value', 'amount_transaction'):
+            return int(float(value))
+
+        return str(value).lower()
+
+    except (TypeError, ValueError):
+        return value
+
+
+def diff_derived_fields(row: dict, recomputed: dict) -> dict:
+    """
+    Derived fields whose recomputed value differs from the stored one. A field
+    the computation left blank is never a change, enrich_transaction can fail
+    part way and leave the fields after the failure unset.
+    """
+    changes = {}
+
+    for field in DERIVED_FIELDS:
+        before = row.get(field)
+        after = recomputed.get(field)
+
+        if after is None:
+            continue
+
+        if normalize_field(field, before) != normalize_field(field, after):
+            changes[field] = {'before': before, 'after': after}
+
+    return changes
+
+
+def recompute_page(page: list[dict], filing_type: str = 'split') -> list[dict | None]:
+    """
+    Derived fields of every row, None for rows without price transactions
+    since there is nothing to derive from and the stored values were typed in.
+    Rows whose transactions cannot be converted come back without a type.
+    """
+    recomputed = []
+
+    for row in page:
+        if not row.get('price_transaction'):
+            recomputed.append(None)
+            continue
+
+        candidate = {
+            'price_transaction': row['price_transaction'],
+            'holding_before': row.get('holding_before', 0),
+            'holding_after': row.get('holding_after', 0)
+        }
+
+        # Scalar on purpose, building batch columns from dict rows costs more than it saves
+        enrich_transaction(candidate, filing_type)
+        recomputed.append(candidate)
+
+    return recomputed
+
+
+def reenrich_filings(
+    store: FilingStore,
+    dry_run: bool = True,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    filing_type: str = 'split'
+) -> dict:
+    """
+    Stream every stored filing, recompute its derived fields and write back
+    only the fields that changed, chunk_size rows per write. Other columns
+    are left alone, so edits made while the job runs are kept. Failed rows
+    are logged and reported, the job carries on with the next chunk.
+    """
+    report = {
+        'dry_run': dry_run,
+        'scanned': 0,
+        'skipped': 0,
+        'changed': 0,
+        'written': 0,
+        'unconvertible_ids': [],
+        'failed_ids': [],
+        'changes': []
+    }
+
+    pending = []
+
+    def flush():
+        if not pending:
+            return
+
+        try:
+            failed_ids = store.update_many(pending)
+
+        except Exception as error:
+            LOGGER.error(f'reenrich update error ids {pending[0]["id"]}..{pending[-1]["id"]}: {error}')
+            failed_ids = [update['id'] for update in pending]
+
+        report['written'] += len(pending) - len(failed_ids)
+        report['failed_ids'].extend(failed_ids)
+
+        pending.clear()
+
+    for page in iter_pages(store, page_size):
+        report['scanned'] += len(page)
+
+        for row, recomputed in zip(page, recompute_page(page, filing_type)):
+            if recomputed is None:
+                report['skipped'] += 1
+                continue
+
+            # Never replace stored values with the blanks of a failed computation
+            if recomputed.get('transaction_type') is None:
+                report['unconvertible_ids'].append(row['id'])
+                continue
+
+            changes = diff_derived_fields(row, recomputed)
+
+            if not changes:
+                continue
+
+            report['changed'] += 1
+            report['changes'].append({'id': row['id'], 'fields': changes})
+
+            if dry_run:
+                continue
+
+            pending.append({'id': row['id'], **{field: change['after'] for field, change in changes.items()}})
+
+            if len(pending) >= chunk_size:
+                flush()
+
+        LOGGER.info(f"reenrich: {report['scanned']} scanned, {report['changed']} changed")
+
+    if not dry_run:
+        flush()
+
+    return report
+
+
+def supabase_store_from_env(table: str = FILINGS_TABLE) -> SupabaseFilingStore:
+    from supabase import create_client
+
+    client = create_client(
+        supabase_url=os.environ['SUPABASE_URL'],
+        supabase_key=os.environ['SUPABASE_KEY']
+    )
+
+    return SupabaseFilingStore(client, table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--apply', action='store_true', help='write changed rows, the default is a dry run')
+    parser.add_argument('--sqlite', help='run against a local SQLite stand-in instead of Supabase')
+    parser.add_argument('--table', default=FILINGS_TABLE)
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--report', help='write the full report as JSON to this path')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.sqlite:
+        store = SqliteFilingStore(args.sqlite, args.table)
+
+    else:
+        store = supabase_store_from_env(args.table)
+
+    report = reenrich_filings(
+        store,
+        dry_run=not args.apply,
+        page_size=args.page_size,
+        chunk_size=args.chunk_size
+    )
+
+    if args.report:
+        with open(args.report, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    mode = 'dry run' if report['dry_run'] else 'applied'
+    print(
+        f"{mode}: {report['scanned']} scanned, {report['skipped']} without transactions, "
+        f"{len(report['unconvertible_ids'])} unconvertible, {report['changed']} changed, "
+        f"{report['written']} written, {len(report['failed_ids'])} failed"
+    )
+
+
+if __name__ == '__main__':
+    main()
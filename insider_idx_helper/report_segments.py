@@ -0,0 +1,267 @@
+from concurrent.futures import Future
+from typing import BinaryIO, Iterator
+
+from insider_idx_helper.parser_idx_helper import (
+    COMPANIES_PATH,
+    TABLE_MODE_TEXT,
+    TABLE_MODE_WORDS,
+    extract_holder_name,
+    extract_symbol_and_company_name,
+    is_transaction_table_page,
+    iter_parser_new_document,
+    open_pdf,
+    scan_header_fields
+)
+from insider_idx_helper.batch_parser import parse_many, submit_parse
+from insider_idx_helper.parse_cache import (
+    ParseCache,
+    get_cached_filings,
+    iter_store_filings,
+    make_cache_key,
+    read_pdf_bytes
+)
+from insider_idx_helper.utils.document_text import DocumentText, as_document_text
+
+import fitz
+import logging
+import re
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Only pages holding the holder label can start a report, the others skip the header scan
+HOLDER_PRECHECK_PATTERN = re.compile(r'sesuai SID', re.IGNORECASE)
+
+# Pages read past the end of a report's table for the header of a next report,
+# a report with none that close is the last one and the rest is its annex
+REPORT_LOOKAHEAD_PAGES = 2
+
+
+def report_fingerprint(text: str) -> dict | None:
+    """
+    Identity of the report whose header is on this page, None without a header.
+    The shares make two reports of the same holder and company distinct.
+    A field missing from the page is None.
+    """
+    if not HOLDER_PRECHECK_PATTERN.search(text):
+        return None
+
+    fields = scan_header_fields(text)
+    holder_name = fields.get('holder_name')
+
+    if not holder_name:
+        return None
+
+    return {
+        'holder_name': ' '.join(holder_name.lower().split()),
+        'symbol': fields.get('symbol'),
+        'holding_before': fields.get('holding_before'),
+        'holding_after': fields.get('holding_after')
+    }
+
+
+def is_same_report(fingerprint: dict, other: dict) -> bool:
+    """
+    Only fields present in both are compared, a header split across pages
+    leaves some of them missing on each page
+    """
+    return all(
+        value is None or other[name] is None or value == other[name]
+        for name, value in fingerprint.items()
+    )
+
+
+def find_report_segments(
+    doc: fitz.Document | DocumentText,
+    lookahead: int = REPORT_LOOKAHEAD_PAGES
+) -> list[dict]:
+    """
+    Split a bundle of "Laporan Kepemilikan" reports into page ranges.
+    A report starts on every page whose header fingerprint differs from the
+    headers of the current report, pages before the first header belong to
+    the first report.
+
+    Scanning stops lookahead pages after the current report's table without
+    a new header, so annex pages are never read. The text of the pages read
+    stays cached in doc, a single report is parsed from it without reading
+    them again.
+    """
+    document_text = as_document_text(doc, keep_layout=False)
+    page_count = len(document_text)
+    segments = []
+
+    table_seen = False
+    pages_after_table = 0
+
+    for page_index in range(page_count):
+        if table_seen and pages_after_table >= lookahead:
+            break
+
+        is_table_page = is_transaction_table_page(document_text, page_index)
+        text = document_text.text(page_index)
+        fingerprint = report_fingerprint(text)
+
+        if fingerprint is not None and not (segments and is_same_report(fingerprint, segments[-1]['fingerprint'])):
+            segments.append({
+                'start': page_index if segments else 0,
+                'fingerprint': fingerprint,
+                'holder_name': extract_holder_name(text),
+                'symbol': extract_symbol_and_company_name(text)[0]
+            })
+
+            table_seen = is_table_page
+            pages_after_table = 0
+            continue
+
+        if fingerprint is not None:
+            segment = segments[-1]
+
+            # Fields the earlier pages of a split header were missing
+            for name, value in fingerprint.items():
+                if segment['fingerprint'][name] is None:
+                    segment['fingerprint'][name] = value
+
+            if segment['symbol'] is None:
+                segment['symbol'] = extract_symbol_and_company_name(text)[0]
+
+        if is_table_page:
+            table_seen = True
+            pages_after_table = 0
+
+        elif table_seen:
+            pages_after_table += 1
+
+    if not segments:
+        segments.append({'start': 0, 'fingerprint': None, 'holder_name': None, 'symbol': None})
+
+    for segment, next_segment in zip(segments, segments[1:] + [{'start': page_count}]):
+        segment['stop'] = next_segment['start']
+
+    return segments
+
+
+def segment_pdf_bytes(doc: fitz.Document, segment: dict) -> bytes:
+    segment_doc = fitz.open()
+
+    try:
+        segment_doc.insert_pdf(doc, from_page=segment['start'], to_page=segment['stop'] - 1)
+        return segment_doc.tobytes()
+
+    finally:
+        segment_doc.close()
+
+
+def split_report_segments(pdf_source: str | bytes | BinaryIO) -> tuple[list[dict], list[bytes]]:
+    doc = open_pdf(pdf_source)
+
+    try:
+        segments = find_report_segments(doc)
+
+        if len(segments) == 1:
+            return segments, [read_pdf_bytes(pdf_source)]
+
+        return segments, [segment_pdf_bytes(doc, segment) for segment in segments]
+
+    finally:
+        doc.close()
+
+
+def parse_bundle(
+    pdf_source: str | bytes | BinaryIO,
+    pdf_url: str,
+    workers: int | None = None,
+    companies_path: str = COMPANIES_PATH
+) -> list[dict]:
+    """
+    Parse every report of a bundled PDF on its own, across a process pool.
+    Returns one group per report, in page order, with the page range, holder,
+    symbol, parsed filings and the error of a segment that failed.
+    """
+    segments, segment_sources = split_report_segments(pdf_source)
+
+    parsed = parse_many(
+        segment_sources,
+        [pdf_url] * len(segment_sources),
+        workers=min(workers or len(segment_sources), len(segment_sources)),
+        companies_path=companies_path
+    )
+
+    groups = []
+    for index, segment in enumerate(segments):
+        groups.append({
+            'pages': [segment['start'], segment['stop']],
+            'holder_name': segment['holder_name'],
+            'symbol': segment['symbol'],
+            'results': parsed['results'][index] or [],
+            'error': parsed['errors'].get(index)
+        })
+
+    return groups
+
+
+def iter_report_filings(segments: list[dict], futures: list[Future], pdf_url: str) -> Iterator[dict]:
+    """
+    Filings of every report in page order, each report's as soon as its
+    parse is done. Failed reports are raised together once every other
+    report has been yielded.
+    """
+    errors = []
+
+    for segment, future in zip(segments, futures):
+        try:
+            yield from future.result()
+
+        except Exception as error:
+            pages = f"pages {segment['start'] + 1}-{segment['stop']}"
+            LOGGER.error(f'parse report error {pdf_url} {pages}: {error}')
+            errors.append(f'{pages}: {type(error).__name__}: {error}')
+
+    if errors:
+        raise RuntimeError('; '.join(errors))
+
+
+def iter_parse_bundle(
+    pdf_source: str | bytes | BinaryIO,
+    pdf_url: str,
+    table_mode: str = TABLE_MODE_TEXT
+) -> Iterator[dict]:
+    """
+    Filings of every report in a PDF, for interactive callers. The parse
+    cache is checked before the PDF is split, a whole bundle is cached once
+    all of its reports parsed. A single report streams through the parse
+    cache as before, the reports of a bundle are parsed in the shared pool
+    and yielded in page order. Failed reports are raised together once
+    every other report has been yielded.
+    """
+    pdf_bytes = read_pdf_bytes(pdf_source)
+
+    cache = ParseCache()
+    key = make_cache_key(pdf_bytes, table_mode)
+    cached = get_cached_filings(cache, key, pdf_url)
+
+    if cached is not None:
+        yield from cached
+        return
+
+    doc = open_pdf(pdf_bytes)
+
+    try:
+        document_text = DocumentText(doc, keep_layout=table_mode == TABLE_MODE_WORDS)
+        segments = find_report_segments(document_text)
+
+        if len(segments) == 1:
+            # Parsed from the page text segmentation already read
+            filings = iter_parser_new_document(document_text, pdf_url, table_mode)
+            yield from iter_store_filings(filings, cache, key)
+            return
+
+        segment_sources = [segment_pdf_bytes(doc, segment) for segment in segments]
+
+    finally:
+        doc.close()
+
+    LOGGER.info(f'{pdf_url}: {len(segments)} reports in one PDF')
+
+    futures = [submit_parse(source, pdf_url, table_mode) for source in segment_sources]
+
+    yield from iter_store_filings(iter_report_filings(segments, futures, pdf_url), cache, key)
@@ -0,0 +1,78 @@
+from datetime import date, datetime
+from functools import lru_cache
+
+import re
+
+
+# Indonesian and English month names, full and abbreviated, keyed in lower case
+MONTHS = {
+    name: f'{number:02d}'
+    for number, names in enumerate([
+        ('jan', 'januari', 'january'),
+        ('feb', 'februari', 'february', 'pebruari'),
+        ('mar', 'maret', 'march'),
+        ('apr', 'april'),
+        ('mei', 'may'),
+        ('jun', 'juni', 'june'),
+        ('jul', 'juli', 'july'),
+        ('agu', 'agt', 'agustus', 'aug', 'august'),
+        ('sep', 'sept', 'september'),
+        ('okt', 'oktober', 'oct', 'october'),
+        ('nov', 'nopember', 'november'),
+        ('des', 'desember', 'dec', 'december')
+    ], start=1)
+    for name in names
+}
+
+# "05-Jan-2024", "5 Januari 2024", "05-Januari-2024"
+DAY_MONTH_YEAR_PATTERN = re.compile(r'\s*(\d{1,2})[\s\-]+([A-Za-z]+)\.?[\s\-]+(\d{4})\s*')
+ISO_DATE_PATTERN = re.compile(r'\s*(\d{4}-\d{2}-\d{2})\s*')
+
+DATE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def normalize_date(date_raw: str) -> str:
+    """
+    "05-Jan-2024" / "5 Januari 2024" -> "2024-01-05". Dates already in ISO
+    form pass through, as does anything else, stripped. An unknown month
+    name falls back to January as the parser always did.
+    """
+    if ISO_DATE_PATTERN.fullmatch(date_raw):
+        return date_raw.strip()
+
+    match = DAY_MONTH_YEAR_PATTERN.fullmatch(date_raw)
+
+    if not match:
+        return date_raw.strip()
+
+    day, month, year = match.groups()
+
+    return f"{year}-{MONTHS.get(month.lower(), '01')}-{day.zfill(2)}"
+
+
+def normalize_dates(values: list[str | None]) -> list[str | None]:
+    """
+    normalize_date over a column, each distinct value is normalized once.
+    A missing value stays None, any other value gives what normalize_date
+    gives, or raises what it raises.
+    """
+    normalized = {value: normalize_date(value) for value in dict.fromkeys(values) if value is not None}
+
+    return [normalized.get(value) for value in values]
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_timestamp(timestamp: str) -> datetime:
+    """
+    Stored timestamps come as "2024-01-05T10:00:00.123", "2024-01-05T10:00:00"
+    or "2024-01-05 10:00:00", all ISO 8601. ValueError for anything else.
+    """
+    return datetime.fromisoformat(timestamp.strip())
+
+
+def parse_date(date_raw: str) -> date:
+    """
+    Any date normalize_date understands as a date, ValueError otherwise
+    """
+    return date.fromisoformat(normalize_date(date_raw))
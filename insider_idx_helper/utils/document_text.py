@@ -0,0 +1,94 @@
+from typing import Iterator
+
+import fitz
+import re
+
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+class DocumentText:
+    """
+    Wraps a fitz.Document so every parser stage shares one text extraction per page.
+    Pages are read lazily, the first time any stage asks for them, and laid out
+    once into a fitz.TextPage that serves both plain text and word boxes.
+
+    keep_layout=False drops each TextPage as soon as its text is read, for
+    callers that never ask for word boxes.
+    """
+
+    def __init__(self, doc: fitz.Document, keep_layout: bool = True):
+        self.doc = doc
+        self.keep_layout = keep_layout
+        self._textpages = {}
+        self._text = {}
+        self._normalized = {}
+        self._words = {}
+
+    def __len__(self) -> int:
+        return len(self.doc)
+
+    def textpage(self, page_index: int) -> fitz.TextPage:
+        if page_index not in self._textpages:
+            self._textpages[page_index] = self.doc[page_index].get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+
+        return self._textpages[page_index]
+
+    def text(self, page_index: int) -> str:
+        if page_index not in self._text:
+            self._text[page_index] = self.textpage(page_index).extractText()
+
+            if not self.keep_layout:
+                self._textpages.pop(page_index, None)
+
+        return self._text[page_index]
+
+    def normalized(self, page_index: int) -> str:
+        """
+        Lowercased page text with all whitespace collapsed to single spaces
+        """
+        if page_index not in self._normalized:
+            self._normalized[page_index] = WHITESPACE_PATTERN.sub(' ', self.text(page_index).lower())
+
+        return self._normalized[page_index]
+
+    def words(self, page_index: int) -> list[tuple]:
+        """
+        Word boxes (x0, y0, x1, y1, word, block_no, line_no, word_no) of the page
+        """
+        if page_index not in self._words:
+            self._words[page_index] = self.textpage(page_index).extractWORDS()
+
+        return self._words[page_index]
+
+    def release_normalized(self, page_index: int):
+        self._normalized.pop(page_index, None)
+
+    def release(self, page_index: int):
+        """
+        Forget everything cached for a page, it is read again if asked for
+        """
+        self._textpages.pop(page_index, None)
+        self._text.pop(page_index, None)
+        self._normalized.pop(page_index, None)
+        self._words.pop(page_index, None)
+
+    def iter_lines(self, start: int, stop: int) -> Iterator[str]:
+        """
+        Raw lines of pages start to stop - 1 as one stream, the same lines as
+        splitting their joined text. Each page is released once its lines are
+        handed out, so only one page layout is held at a time. Whatever the
+        caller builds from the lines still grows with the page count.
+        """
+        for page_index in range(start, stop):
+            lines = self.text(page_index).split('\n')
+            self.release(page_index)
+
+            yield from lines
+
+
+def as_document_text(doc: fitz.Document | DocumentText, keep_layout: bool = True) -> DocumentText:
+    if isinstance(doc, DocumentText):
+        return doc
+
+    return DocumentText(doc, keep_layout)
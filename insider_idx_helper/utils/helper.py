@@ -1,3 +1,6 @@
+from insider_idx_helper.utils.date_format import normalize_date
+from insider_idx_helper.utils.number_format import normalize_number, normalize_percentage
+
 import logging 
 import re
 
@@ -73,13 +76,8 @@ def crosses_50_percent_threshold(
 
 
 def clean_number(num_str) -> int:
-    if not num_str:
-        return None
-    
-    clean_str = num_str.replace('.', '').replace(',', '.')
-
     try:
-        return int(float(clean_str))
+        return normalize_number(num_str)
     
     except ValueError as error:
         LOGGER.error(f'clean number error: {error} {num_str}')
@@ -87,13 +85,8 @@ def clean_number(num_str) -> int:
 
 
 def clean_percentage(num_str) -> float:
-    if not num_str: 
-        return None
-    
-    clean_str = num_str.replace('%', '').strip().replace(',', '.')
-
     try:
-        return round(float(clean_str), 3)
+        return normalize_percentage(num_str)
     
     except ValueError as error:
         LOGGER.error(f'clean percentage error: {error}')
@@ -102,24 +95,7 @@ def clean_percentage(num_str) -> float:
 
 def standardize_date(date_raw: str) -> str:
     try:
-        month_map = {
-            'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
-            'Mei': '05', 'Jun': '06', 'Jul': '07', 'Agu': '08',
-            'Sep': '09', 'Okt': '10', 'Nov': '11', 'Des': '12'
-        }
-
-        parts = date_raw.split('-')
-        
-        if len(parts) == 3:
-            day = parts[0].zfill(2)
-            month = month_map.get(parts[1].strip(), '01')
-            year = parts[2]
-            date = f"{year}-{month}-{day}"
-
-        else:
-            date = date_raw 
-
-        return date.strip()
+        return normalize_date(date_raw)
     
     except Exception as error:
         LOGGER.error(f'standardize date error: {error}') 
@@ -0,0 +1,146 @@
+import numpy as np
+
+
+# "1.234.567,89" -> "1234567.89", dots group thousands and the comma is the decimal mark.
+# Only for text as printed in a disclosure, numbers the parser already stored
+# use the decimal point and would lose it here.
+NUMBER_TABLE = str.maketrans({'.': None, ',': '.'})
+PERCENTAGE_TABLE = str.maketrans({'%': None, ',': '.'})
+
+# Joins a whole column so it is translated in a single call
+COLUMN_SEPARATOR = '\x00'
+
+# Truncated values outside [INT64_MIN, INT64_LIMIT) do not fit an int64 column
+INT64_MIN = -float(2 ** 63)
+INT64_LIMIT = float(2 ** 63)
+
+
+def normalize_number(text: str) -> int | None:
+    """
+    "1.234.567,89" -> 1234567, truncated like int(float()).
+    None for empty input, ValueError for text that is not a number.
+    """
+    if not text:
+        return None
+
+    return int(float(text.translate(NUMBER_TABLE)))
+
+
+def normalize_percentage(text: str) -> float | None:
+    """
+    "12,5 %" -> 12.5, rounded to 3 decimals.
+    None for empty input, ValueError for text that is not a number.
+    """
+    if not text:
+        return None
+
+    return round(float(text.translate(PERCENTAGE_TABLE)), 3)
+
+
+def translate_column(values: list[str | None], table: dict) -> list[str]:
+    """
+    Every value translated in a single call on the joined column, empty
+    values become "nan" so the column converts without gaps
+    """
+    texts = [value or 'nan' for value in values]
+    translated = COLUMN_SEPARATOR.join(texts).translate(table).split(COLUMN_SEPARATOR)
+
+    # A value holding the separator itself would shift every later value
+    if len(translated) != len(texts):
+        translated = [text.translate(table) for text in texts]
+
+    return translated
+
+
+def round_column(values: np.ndarray, digits: int) -> np.ndarray:
+    """
+    np.round, except for values sitting on a half where it can land on the
+    other side of Python's round, those are rounded one by one
+    """
+    rounded = np.round(values, digits)
+
+    scaled = values * 10 ** digits
+    near_half = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+
+    for index in near_half.tolist():
+        rounded[index] = round(float(values[index]), digits)
+
+    return rounded
+
+
+def to_float_column(values: list[str | None], texts: list[str]) -> tuple[np.ndarray, np.ndarray, dict[int, str]]:
+    """
+    Float64 column of translated texts, NaN where a value is empty or bad.
+    The column is converted in one pass, values are only retried one by one
+    when that pass hits a bad one.
+    """
+    valid = np.fromiter(map(bool, values), dtype=bool, count=len(values))
+
+    try:
+        return np.fromiter(map(float, texts), dtype=np.float64, count=len(texts)), valid, {}
+
+    except ValueError:
+        pass
+
+    floats = np.full(len(texts), np.nan)
+    errors = {}
+
+    for index, text in enumerate(texts):
+        try:
+            floats[index] = float(text)
+
+        except ValueError:
+            valid[index] = False
+            errors[index] = text
+
+    return floats, valid, errors
+
+
+def invalidate(valid: np.ndarray, errors: dict[int, str], rejected: np.ndarray):
+    """
+    Mark the rejected entries that still count as valid as bad inputs
+    """
+    bad = np.flatnonzero(valid & rejected)
+    valid[bad] = False
+    errors.update({index: None for index in bad.tolist()})
+
+
+def normalize_numbers(values: list[str | None]) -> dict:
+    """
+    normalize_number over a whole column. Returns the int64 values, a mask of
+    the entries that held a number, zero elsewhere, and the bad inputs keyed
+    by position instead of one log line each. "nan", "inf" and numbers too
+    large for int64 are bad inputs, normalize_number would return them as a
+    Python int or raise.
+    """
+    floats, valid, errors = to_float_column(values, translate_column(values, NUMBER_TABLE))
+
+    # "nan" and "inf" parse as floats but are no share count
+    invalidate(valid, errors, ~np.isfinite(floats))
+
+    with np.errstate(invalid='ignore'):
+        truncated = np.trunc(floats)
+        invalidate(valid, errors, (truncated < INT64_MIN) | (truncated >= INT64_LIMIT))
+
+    return {
+        'values': np.where(valid, np.nan_to_num(truncated), 0).astype(np.int64),
+        'valid': valid,
+        'errors': {index: values[index] for index in sorted(errors)}
+    }
+
+
+def normalize_percentages(values: list[str | None]) -> dict:
+    """
+    normalize_percentage over a whole column, NaN where there is no number.
+    Same shape of result as normalize_numbers, "nan" and "inf" are bad inputs
+    here too.
+    """
+    floats, valid, errors = to_float_column(values, translate_column(values, PERCENTAGE_TABLE))
+
+    invalidate(valid, errors, ~np.isfinite(floats))
+
+    return {
+        'values': round_column(np.where(valid, floats, np.nan), 3),
+        'valid': valid,
+        'errors': {index: values[index] for index in sorted(errors)}
+    }
@@ -0,0 +1,131 @@
+from functools import lru_cache
+
+from insider_idx_helper.utils.helper import (
+    KEYWORD_BUY,
+    KEYWORD_SELL,
+    KEYWORD_TRANSFER,
+    KEYWORD_INHERIT,
+    KEYWORD_MESOP,
+    KEYWORD_FREEFLOAT,
+    KEYWORD_RESTRUCTURING,
+    KEYWORD_REPURCHASE,
+    KEYWORD_PLACEMENT
+)
+
+import bisect
+import re
+
+
+# Tag -> keywords, tags come back in this order
+PURPOSE_CATEGORIES = {
+    'buy': KEYWORD_BUY,
+    'sell': KEYWORD_SELL,
+    'transfer': KEYWORD_TRANSFER,
+    'inherit': KEYWORD_INHERIT,
+    'mesop': KEYWORD_MESOP,
+    'free-float': KEYWORD_FREEFLOAT,
+    'restructuring': KEYWORD_RESTRUCTURING,
+    'repurchase': KEYWORD_REPURCHASE,
+    'placement': KEYWORD_PLACEMENT
+}
+
+# Joins a column of purposes for a single scan, no keyword contains it so no match spans two
+PURPOSE_SEPARATOR = '\n'
+
+
+class PurposeClassifier:
+    """
+    Every keyword of every category in one compiled pattern, so a purpose is
+    scanned once instead of once per keyword. Labels a purpose exactly like
+    any(keyword in purpose.lower()) per category would.
+
+    Matches are found at every position through a lookahead, so keywords may
+    overlap. Only the longest keyword starting at a position is reported, so
+    each keyword also carries the categories of the keywords it contains.
+    """
+
+    def __init__(self, categories: dict[str, list[str]]):
+        self.tags = list(categories)
+        bits = {tag: 1 << index for index, tag in enumerate(self.tags)}
+
+        keywords = {keyword.lower() for words in categories.values() for keyword in words}
+        keywords = sorted(keywords, key=len, reverse=True)
+
+        self.keyword_masks = {
+            keyword: sum(
+                bits[tag]
+                for tag, words in categories.items()
+                if any(word.lower() in keyword for word in words)
+            )
+            for keyword in keywords
+        }
+
+        first_letters = ''.join(sorted({re.escape(keyword[0]) for keyword in keywords}))
+        alternation = '|'.join(re.escape(keyword) for keyword in keywords)
+
+        # The first letter class lets the scan skip most positions cheaply
+        self.pattern = re.compile(f'(?=[{first_letters}])(?=({alternation}))')
+
+        self._labels = {}
+
+    def labels(self, mask: int) -> tuple[str, ...]:
+        labels = self._labels.get(mask)
+
+        if labels is None:
+            labels = tuple(tag for index, tag in enumerate(self.tags) if mask >> index & 1)
+            self._labels[mask] = labels
+
+        return labels
+
+    def mask(self, text_lower: str) -> int:
+        mask = 0
+
+        for keyword in self.pattern.findall(text_lower):
+            mask |= self.keyword_masks[keyword]
+
+        return mask
+
+    def classify(self, purpose: str | None) -> tuple[str, ...]:
+        if not purpose:
+            return ()
+
+        return self.labels(self.mask(purpose.lower()))
+
+    def classify_many(self, purposes: list[str | None]) -> list[tuple[str, ...]]:
+        """
+        Tags of every purpose. Distinct purposes are lowered, joined and
+        scanned in one pass, matches are mapped back by offset.
+        """
+        distinct = list(dict.fromkeys(purpose for purpose in purposes if purpose))
+        texts = [purpose.lower() for purpose in distinct]
+
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        masks = [0] * len(texts)
+        keyword_masks = self.keyword_masks
+
+        for match in self.pattern.finditer(PURPOSE_SEPARATOR.join(texts)):
+            masks[bisect.bisect_right(starts, match.start()) - 1] |= keyword_masks[match.group(1)]
+
+        tags = {purpose: self.labels(mask) for purpose, mask in zip(distinct, masks)}
+
+        return [tags.get(purpose, ()) if purpose else () for purpose in purposes]
+
+
+PURPOSE_CLASSIFIER = PurposeClassifier(PURPOSE_CATEGORIES)
+
+
+@lru_cache(maxsize=4096)
+def classify_purpose(purpose: str | None) -> tuple[str, ...]:
+    """
+    "Investasi dan pelaksanaan MESOP" -> ('buy', 'mesop')
+    """
+    return PURPOSE_CLASSIFIER.classify(purpose)
+
+
+def classify_purposes(purposes: list[str | None]) -> list[tuple[str, ...]]:
+    return PURPOSE_CLASSIFIER.classify_many(purposes)
@@ -0,0 +1,104 @@
+from contextlib import contextmanager
+from typing import Callable
+
+import json
+import logging
+import os
+import time
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class StageTimer:
+    """
+    Wall clock time spent in each parser stage of one document.
+    A stage entered more than once, such as the enrich_transaction passes,
+    adds up under a single name. The stage running when report is called
+    comes back as current, with the time spent in it so far.
+    """
+
+    def __init__(self, source: str | None = None):
+        self.source = source
+        self.current = None
+        self.stages = {}
+        self.calls = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        # A document stuck in a stage shows up here before any report exists,
+        # stages entered more than once are logged on their first pass
+        if name not in self.calls:
+            LOGGER.info(f'{self.source}: {name} started')
+
+        started = time.perf_counter()
+        self.current = (name, started)
+
+        try:
+            yield
+
+        finally:
+            elapsed = (time.perf_counter() - started) * 1e3
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self.current = None
+
+    def report(self) -> dict:
+        report = {
+            'source': self.source,
+            'total_ms': round(sum(self.stages.values()), 3),
+            'stages': [
+                {'stage': name, 'ms': round(elapsed, 3), 'calls': self.calls[name]}
+                for name, elapsed in self.stages.items()
+            ],
+            'current': None
+        }
+
+        if self.current is not None:
+            name, started = self.current
+            report['current'] = {'stage': name, 'ms': round((time.perf_counter() - started) * 1e3, 3)}
+
+        return report
+
+
+def log_timings(report: dict):
+    stages = ', '.join(f"{stage['stage']}={stage['ms']}ms" for stage in report['stages'])
+    current = report.get('current')
+    running = f", {current['stage']} running for {current['ms']}ms" if current else ''
+
+    LOGGER.info(f"parse timings {report['source']}: total={report['total_ms']}ms {stages}{running}")
+
+
+class JsonlTimingSink:
+    """
+    Appends one JSON line per parsed document, for offline analysis
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __call__(self, report: dict):
+        try:
+            with open(self.path, 'a') as file:
+                file.write(json.dumps({'recorded_at': time.time(), **report}) + '\n')
+
+        except Exception as error:
+            LOGGER.error(f'timing sink error: {error}')
+
+
+# Receives every finished report, None turns emission off
+TIMING_SINK = log_timings
+
+
+def set_timing_sink(sink: Callable[[dict], None] | None):
+    global TIMING_SINK
+    TIMING_SINK = sink
+
+
+def emit_timings(report: dict):
+    if TIMING_SINK is not None:
+        TIMING_SINK(report)
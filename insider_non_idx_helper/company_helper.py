@@ -0,0 +1,46 @@
+from insider_idx_helper.utils.helper import to_kebab
+from utils.company_index import get_company_index
+
+import streamlit as st
+
+
+# Confidence needed before a typed company name fills the ticker on its own
+AUTOFILL_MIN_SCORE = 0.6
+
+
+def resolve_subsector(ticker: str | None) -> str:
+    """
+    Kebab case subsector of a ticker, empty when the ticker is unknown
+    """
+    company = get_company_index().get(ticker)
+
+    if not company:
+        return ""
+
+    return to_kebab(company.get('sub_sector'))
+
+
+def fill_subsector(suffix: str = ""):
+    """
+    on_change callback for a ticker field, fills the matching subsector field
+    """
+    st.session_state[f"subsector{suffix}"] = resolve_subsector(st.session_state.get(f"ticker{suffix}"))
+
+
+def search_companies(company_name: str | None, limit: int = 5) -> list[dict]:
+    return get_company_index().search(company_name, limit=limit)
+
+
+def fill_ticker_from_name(suffix: str = ""):
+    """
+    on_change callback for a company name field, takes the best match's ticker
+    when none has been entered yet
+    """
+    if st.session_state.get(f"ticker{suffix}"):
+        return
+
+    candidates = search_companies(st.session_state.get(f"company_name{suffix}"), limit=1)
+
+    if candidates and candidates[0]['score'] >= AUTOFILL_MIN_SCORE:
+        st.session_state[f"ticker{suffix}"] = candidates[0]['symbol']
+        fill_subsector(suffix)
@@ -2,6 +2,12 @@ import streamlit as st
 from datetime import datetime as dt
 from typing import Callable
 
+from insider_non_idx_helper.company_helper import (
+    fill_subsector, 
+    fill_ticker_from_name, 
+    search_companies
+)
+
 import streamlit as st
 import uuid 
 import time
@@ -121,8 +127,16 @@ def render_single_form(form_number: int):
     st.text_input(
         "Company Name:red[*]", 
         placeholder="Enter company name", 
-        key=f"company_name{suffix}"
+        key=f"company_name{suffix}",
+        on_change=fill_ticker_from_name,
+        args=(suffix,)
     )
+
+    candidates = search_companies(st.session_state.get(f"company_name{suffix}"))
+    if candidates:
+        st.caption("Matching tickers: " + ", ".join(
+            f"{candidate['symbol']} ({candidate['company_name']})" for candidate in candidates
+        ))
     
     st.text_input(
         "Holder Name:red[*]", 
@@ -133,7 +147,9 @@ def render_single_form(form_number: int):
     st.text_input(
         "Ticker:red[*]", 
         placeholder="Enter ticker", 
-        key=f"ticker{suffix}"
+        key=f"ticker{suffix}",
+        on_change=fill_subsector,
+        args=(suffix,)
     )
     
     st.text_input(
@@ -2,13 +2,14 @@ from datetime import datetime
 
 from insider_non_idx_helper.single_filing_helper import main_ui_single
 from insider_non_idx_helper.pair_filing_helper import main_ui_pair
+from insider_non_idx_helper.company_helper import resolve_subsector
+from utils.news_api import get_news_api
 # from insert_trading_function import insert_insider_trading_supabase
 
 import streamlit as st
-import requests
 
 # data
-API_KEY = st.secrets["API_KEY"]
+NEWS_API = get_news_api(st.secrets["API_KEY"])
 SUPABASE_URL = st.secrets["SUPABASE_URL"]
 SUPABASE_KEY = st.secrets["SUPABASE_KEY"]
 
@@ -67,7 +68,8 @@ def post(form_number: int = None):
         "share_percentage_before": st.session_state.get(f"share_percentage_before{suffix}"),
         "holding_after": st.session_state.get(f"holding_after{suffix}"),
         "share_percentage_after": st.session_state.get(f"share_percentage_after{suffix}"),
-        "sub_sector": st.session_state.get(f"subsector{suffix}", ""),
+        # The single form sits inside st.form, so its subsector is resolved here rather than on change
+        "sub_sector": resolve_subsector(st.session_state.get(f"ticker{suffix}")) or st.session_state.get(f"subsector{suffix}", ""),
         "purpose": st.session_state.get(f"purpose{suffix}"),
         "holder_type": st.session_state.get(f"holder_type{suffix}"),
         'tags': st.session_state.get(f"tags{suffix}", ""),
@@ -83,14 +85,7 @@ def post(form_number: int = None):
         with st.expander("🔍 Debug - Request Data"):
             st.json(data)
 
-        headers = {
-            "Authorization": f"Bearer {API_KEY}"
-        }
-
-        response = requests.post(
-            "https://sectors-news-endpoint.fly.dev/insider-trading", 
-            headers = headers, json=data
-        )
+        response = NEWS_API.create_insider_trading(data)
         
         if response.status_code == 200:
             if not is_pair_filings:
@@ -1,7 +1,13 @@
 from datetime import datetime as dt
 from supabase import create_client 
 
-from insider_idx_helper.parser_idx_helper import parser_new_document
+from insider_idx_helper.parse_cache import iter_parse_with_cache
+from insider_idx_helper.batch_parser import submit_parse
+from insider_idx_helper.parse_service import connect_parse_service, submit_to_service
+from insider_idx_helper.report_segments import iter_parse_bundle
+from insider_idx_helper.utils.date_format import parse_timestamp
+from insider_idx_helper.utils.purpose_classifier import classify_purpose
+from utils.news_api import get_news_api
 # from test_add_insider_pdf import insert_insider_trading_supabase
 
 import streamlit as st
@@ -12,10 +18,13 @@ import tempfile
 
 
 # data
-API_KEY = st.secrets["API_KEY"]
+NEWS_API = get_news_api(st.secrets["API_KEY"])
 SUPABASE_URL = st.secrets["SUPABASE_URL"]
 SUPABASE_KEY = st.secrets["SUPABASE_KEY"]
 
+# Seconds to wait on a document parsed in the worker pool
+PARSE_TIMEOUT = 120
+
 AVAILABLE_SUBSECTORS = [
   "alternative-energy",
   "apparel-luxury-goods",
@@ -58,8 +67,12 @@ def format_option(option):
 
 
 def save_temp(st_file):
+    """
+    Compatibility shim for callers that still need a file path.
+    generate() parses uploads in memory, the caller owns deleting this file.
+    """
     with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        tmp.write(st_file.read())
+        tmp.write(st_file.getvalue())
         tmp_path = tmp.name 
     return tmp_path
 
@@ -92,7 +105,7 @@ def populate_session_from_data(data: dict, prefix: str):
     if data is None:
         return False
     
-    timestamp = dt.strptime(data.get("timestamp", dt.now().strftime("%Y-%m-%d %H:%M:%S")), "%Y-%m-%d %H:%M:%S")
+    timestamp = parse_timestamp(data["timestamp"]) if data.get("timestamp") else dt.now().replace(microsecond=0)
     
     st.session_state[f"{prefix}_source"] = data.get("source", "")
     st.session_state[f"{prefix}_subsector"] = data.get("sub_sector", AVAILABLE_SUBSECTORS[0])
@@ -148,32 +161,114 @@ def generate():
         st.toast("Please fill out the required fields.")
         return
 
-    try:
-        main_temp_path = save_temp(st.session_state.file)
-        main_results = parser_new_document(
-            pdf_local_path=main_temp_path, pdf_url=st.session_state.pdf_source
+    # Both PDFs go to the parse service right away, the post view only waits for them
+    st.session_state.pending_parse = {
+        "pdf": submit_parse_job(st.session_state.file.getvalue(), st.session_state.pdf_source),
+        "recipient": (
+            submit_parse_job(st.session_state.recipient_file.getvalue(), st.session_state.recipient_source)
+            if st.session_state.share_transfer else None
         )
-        st.session_state.pdf_results = main_results
-        for idx, result in enumerate(main_results):
-            populate_session_from_data(result, f"pdf_{idx}")
+    }
+    st.session_state.pdf_results = []
+    st.session_state.recipient_results = []
+    st.session_state.submitted_forms = set()
+    st.session_state.pdf_view = "post"
 
-        if st.session_state.share_transfer:
-            recipient_temp_path = save_temp(st.session_state.recipient_file)
-            recipient_results = parser_new_document(
-                pdf_local_path=recipient_temp_path, pdf_url=st.session_state.recipient_source
-            )
-            st.session_state.recipient_results = recipient_results
-            for idx, result in enumerate(recipient_results):
-                populate_session_from_data(result, f"recipient_{idx}")
 
-        st.session_state.submitted_forms = set()
-        st.session_state.pdf_view = "post"
+def submit_parse_job(pdf_bytes: bytes, pdf_url: str) -> dict:
+    """
+    Job of the local parse service, or the PDF itself to be parsed in this
+    process when no service is running
+    """
+    try:
+        return {"job_id": submit_to_service(pdf_bytes, pdf_url)}
+
+    except ConnectionError:
+        return {"source": (pdf_bytes, pdf_url)}
+
+    except Exception as error:
+        return {"error": f"{type(error).__name__}: {error}"}
+
+
+def render_result(prefix: str, idx: int, result: dict, document_label: str):
+    transaction_type = result.get('transaction_type', 'transaction').title()
+    label = f"{document_label} - {transaction_type}"
+
+    with st.expander(label, expanded=True):
+        render_form_fields(f"{prefix}_{idx}", label)
+
+
+def stream_results(prefix: str, document_label: str, filings):
+    """
+    Populate and render each filing for prefix as it arrives.
+    Errors are shown under the document that raised them.
+    """
+    # A rerun in the middle of a stream starts the document over
+    results = []
+    st.session_state[f"{prefix}_results"] = results
+
+    try:
+        with st.spinner(f"Parsing {document_label}..."):
+            for result in filings:
+                idx = len(results)
+                populate_session_from_data(result, f"{prefix}_{idx}")
+                results.append(result)
+
+                render_result(prefix, idx, result, document_label)
 
     except Exception as error:
-        st.error(f"Error parsing PDF: {str(error)}")
+        st.error(f"Error parsing {document_label}: {str(error)}")
         st.code(traceback.format_exc())
 
 
+def future_filings(future):
+    # Waits on first iteration, inside stream_results, so its errors land under the document
+    yield from future.result(timeout=PARSE_TIMEOUT)
+
+
+def job_filings(job: dict):
+    if "error" in job:
+        raise RuntimeError(job["error"])
+
+    yield from connect_parse_service().result(job["job_id"], PARSE_TIMEOUT)
+
+
+def parse_pending():
+    """
+    Jobs of the parse service run side by side in its pool, the page only
+    waits for their filings. Without a service the recipient PDF of a pair
+    filing is parsed in a worker process while the main PDF streams in here.
+    """
+    pending = st.session_state.pending_parse
+    recipient_filings = None
+
+    if pending["recipient"] is not None and "source" not in pending["recipient"]:
+        recipient_filings = job_filings(pending["recipient"])
+
+    elif pending["recipient"] is not None:
+        recipient_bytes, recipient_url = pending["recipient"]["source"]
+
+        try:
+            recipient_filings = future_filings(submit_parse(recipient_bytes, recipient_url))
+
+        except Exception as error:
+            # No pool available, parse it here after the main PDF instead
+            st.warning(f"Recipient PDF will be parsed after the main PDF: {str(error)}")
+            recipient_filings = iter_parse_with_cache(pdf_source=recipient_bytes, pdf_url=recipient_url)
+
+    if "source" not in pending["pdf"]:
+        stream_results("pdf", "Main PDF", job_filings(pending["pdf"]))
+
+    else:
+        # Parsed straight from the upload bytes, repeat uploads come from the parse cache.
+        # A PDF bundling several holders' reports gets forms for every report.
+        pdf_bytes, pdf_url = pending["pdf"]["source"]
+        stream_results("pdf", "Main PDF", iter_parse_bundle(pdf_source=pdf_bytes, pdf_url=pdf_url))
+
+    if recipient_filings is not None:
+        stream_results("recipient", "Recipient PDF", recipient_filings)
+
+
 def post_form(prefix: str, form_label: str):
     """
     Submit a single form identified by prefix
@@ -224,7 +319,9 @@ def post_form(prefix: str, form_label: str):
         'symbol': st.session_state[f"{prefix}_symbol"],
         'price_transaction': final_transaction,
         'flag_tags': st.session_state[f"{prefix}_flag_tags"],
-        'purpose': st.session_state[f"{prefix}_purpose"]
+        'purpose': st.session_state[f"{prefix}_purpose"],
+        # Next to the tags the backend assigns, from the purpose as submitted
+        'purpose_tags': list(classify_purpose(st.session_state[f"{prefix}_purpose"]))
     }
     
     # Add UID for pair filings
@@ -241,19 +338,11 @@ def post_form(prefix: str, form_label: str):
         else:
             data['share_transfer'] = True
     
-    headers = {"Authorization": f"Bearer {API_KEY}"}
-    
     try:
         with st.expander(f"Debug - {form_label} Request Data"):
             st.json(data)
         
-        res = requests.post(
-            "https://sectors-news-endpoint.fly.dev/pdf/post", 
-            
-            headers=headers, 
-            json=data,
-            timeout=60
-        )
+        res = NEWS_API.post_pdf_filing(data)
 
         # print(f'response result: {res.json()}')
 
@@ -566,19 +655,17 @@ def main_ui():
         
         st.caption(":red[*] _required_")
         
+        if st.session_state.get('pending_parse'):
+            parse_pending()
+            st.session_state.pending_parse = None
+            return
+
         for idx, result in enumerate(st.session_state.get('pdf_results', [])):
-            transaction_type = result.get('transaction_type', 'transaction').title()
-            label = f"Main PDF - {transaction_type}"
-            with st.expander(label, expanded=True):
-                render_form_fields(f"pdf_{idx}", label)
+            render_result("pdf", idx, result, "Main PDF")
 
         if st.session_state.share_transfer:
             for idx, result in enumerate(st.session_state.get('recipient_results', [])):
-                transaction_type = result.get('transaction_type', 'transaction').title()
-                label = f"Recipient PDF - {transaction_type}"
-                
-                with st.expander(label, expanded=True):
-                    render_form_fields(f"recipient_{idx}", label)
+                render_result("recipient", idx, result, "Recipient PDF")
 
 
 if __name__ == "__main__":
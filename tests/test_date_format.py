@@ -0,0 +1,17 @@
+import pytest
+
+from insider_idx_helper.utils.date_format import normalize_date, normalize_dates
+
+
+def test_normalize_dates_matches_scalar():
+    values = ['5 Januari 2024', '05-Jan-2024', None, '2024-01-05', 'kemarin', '', '5 Januari 2024']
+
+    assert normalize_dates(values) == [None if value is None else normalize_date(value) for value in values]
+
+
+def test_normalize_dates_raises_like_scalar():
+    with pytest.raises(TypeError):
+        normalize_date(20240105)
+
+    with pytest.raises(TypeError):
+        normalize_dates(['5 Januari 2024', 20240105])
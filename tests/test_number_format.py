@@ -0,0 +1,48 @@
+import warnings
+
+import numpy as np
+
+from insider_idx_helper.utils.number_format import (
+    normalize_number,
+    normalize_numbers,
+    normalize_percentage,
+    normalize_percentages
+)
+
+
+def test_normalize_numbers_matches_scalar():
+    values = ['1.234.567,89', '0', None, '12', '-3,5']
+    result = normalize_numbers(values)
+
+    assert result['valid'].tolist() == [True, True, False, True, True]
+    assert result['values'].tolist() == [normalize_number(value) or 0 for value in values]
+    assert result['errors'] == {}
+
+
+def test_normalize_numbers_rejects_values_beyond_int64():
+    values = ['9.223.372.036.854.775.807', '99.999.999.999.999.999.999', '-99.999.999.999.999.999.999', '5']
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = normalize_numbers(values)
+
+    assert result['valid'].tolist() == [False, False, False, True]
+    assert result['values'].tolist() == [0, 0, 0, 5]
+    assert sorted(result['errors']) == [0, 1, 2]
+
+
+def test_normalize_numbers_rejects_non_finite():
+    result = normalize_numbers(['nan', 'inf', '-inf', '7'])
+
+    assert result['valid'].tolist() == [False, False, False, True]
+    assert result['values'].tolist() == [0, 0, 0, 7]
+    assert result['errors'] == {0: 'nan', 1: 'inf', 2: '-inf'}
+
+
+def test_normalize_percentages_rejects_non_finite():
+    result = normalize_percentages(['nan', 'inf', '12,5 %', 'abc'])
+
+    assert result['valid'].tolist() == [False, False, True, False]
+    assert np.isnan(result['values'][[0, 1, 3]]).all()
+    assert result['values'][2] == normalize_percentage('12,5 %')
+    assert result['errors'] == {0: 'nan', 1: 'inf', 3: 'abc'}
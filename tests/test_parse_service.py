@@ -0,0 +1,72 @@
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+from insider_idx_helper import batch_parser, parse_service
+from insider_idx_helper.parse_service import ParseService
+
+
+class BrokenExecutor:
+    def __init__(self):
+        self.shutdowns = 0
+
+    def submit(self, *args):
+        raise BrokenProcessPool('worker died')
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shutdowns += 1
+
+
+class WorkingExecutor:
+    def submit(self, fn, *args):
+        return args
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def make_service(executor) -> ParseService:
+    service = ParseService.__new__(ParseService)
+    service.workers = 1
+    service.companies_path = None
+    service.executor = executor
+    service.executor_lock = threading.Lock()
+
+    return service
+
+
+def test_concurrent_submits_restart_broken_pool_once(monkeypatch):
+    created = []
+
+    def create_parse_executor(workers, companies_path):
+        created.append(WorkingExecutor())
+        return created[-1]
+
+    monkeypatch.setattr(parse_service, 'create_parse_executor', create_parse_executor)
+    broken = BrokenExecutor()
+    service = make_service(broken)
+    barrier = threading.Barrier(4)
+
+    def submit():
+        barrier.wait()
+        service._submit_segment(b'%PDF', 'url', 'text')
+
+    threads = [threading.Thread(target=submit) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert broken.shutdowns == 1
+    assert service.executor is created[0]
+
+
+def test_reset_shared_executor_keeps_replaced_pool(monkeypatch):
+    current = WorkingExecutor()
+    monkeypatch.setattr(batch_parser, 'SHARED_EXECUTOR', current)
+
+    batch_parser.reset_shared_executor(BrokenExecutor())
+
+    assert batch_parser.SHARED_EXECUTOR is current
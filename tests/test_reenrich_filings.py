@@ -0,0 +1,74 @@
+import json
+import sqlite3
+
+from insider_idx_helper.reenrich_filings import SqliteFilingStore, reenrich_filings
+
+
+def make_store(tmp_path, rows: list[dict]) -> SqliteFilingStore:
+    store = SqliteFilingStore(str(tmp_path / 'filings.sqlite3'))
+
+    with sqlite3.connect(store.path) as connection:
+        connection.executemany(
+            f"INSERT INTO {store.table} (id, payload) VALUES (?, ?)",
+            [(row['id'], json.dumps(row)) for row in rows]
+        )
+
+    return store
+
+
+def test_none_amount_keeps_stored_amount_transaction(tmp_path):
+    store = make_store(tmp_path, [{
+        'id': 1,
+        'price': 1,
+        'transaction_value': 1,
+        'transaction_type': 'sell',
+        'amount_transaction': 10,
+        'price_transaction': [
+            {'type': 'buy', 'amount_transacted': 10, 'price': 100.0},
+            {'type': 'buy', 'amount_transacted': None, 'price': 100.0}
+        ]
+    }])
+
+    report = reenrich_filings(store, dry_run=False)
+    row = store.fetch_page(None, 10)[0]
+
+    assert report['failed_ids'] == []
+    assert row['amount_transaction'] == 10
+    assert row['transaction_type'] == 'buy'
+    assert row['price'] == 100.0
+
+
+def test_write_back_keeps_other_columns(tmp_path):
+    store = make_store(tmp_path, [{
+        'id': 1,
+        'title': 'edited',
+        'price': 1,
+        'transaction_value': 1000,
+        'transaction_type': 'buy',
+        'amount_transaction': 100,
+        'price_transaction': [{'type': 'buy', 'amount_transacted': 100, 'price': 10.0}]
+    }])
+
+    report = reenrich_filings(store, dry_run=False)
+    row = store.fetch_page(None, 10)[0]
+
+    assert report['written'] == 1
+    assert row['title'] == 'edited'
+    assert row['price'] == 10.0
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    store = make_store(tmp_path, [{
+        'id': 1,
+        'price': 1,
+        'transaction_value': 1000,
+        'transaction_type': 'buy',
+        'amount_transaction': 100,
+        'price_transaction': [{'type': 'buy', 'amount_transacted': 100, 'price': 10.0}]
+    }])
+
+    report = reenrich_filings(store, dry_run=True)
+
+    assert report['changed'] == 1
+    assert report['written'] == 0
+    assert store.fetch_page(None, 10)[0]['price'] == 1
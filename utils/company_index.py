@@ -0,0 +1,137 @@
+from collections import Counter
+from functools import lru_cache
+
+import json
+import re
+
+
+COMPANIES_PATH = 'data/companies.json'
+
+# Legal form tokens dropped when comparing company names
+NAME_NOISE_PATTERN = re.compile(r'\b(?:PT|TBK|PERSERO)\b')
+NAME_PUNCTUATION_PATTERN = re.compile(r'[^A-Z0-9]+')
+
+# Minimum Dice similarity of trigram sets for a search candidate
+MIN_SEARCH_SCORE = 0.3
+
+
+def normalize_symbol(symbol: str | None) -> str | None:
+    if not symbol:
+        return None
+
+    symbol = symbol.strip().upper()
+
+    if '.' not in symbol:
+        symbol = f'{symbol}.JK'
+
+    return symbol
+
+
+def normalize_company_name(company_name: str | None) -> str | None:
+    """
+    "PT Bank Central Asia Tbk." -> "BANK CENTRAL ASIA"
+    """
+    if not company_name:
+        return None
+
+    name = NAME_PUNCTUATION_PATTERN.sub(' ', company_name.upper())
+    name = NAME_NOISE_PATTERN.sub(' ', name)
+
+    return ' '.join(name.split()) or None
+
+
+def trigrams(text: str) -> set[str]:
+    padded = f'  {text} '
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class CompanyIndex:
+    """
+    In-memory view of data/companies.json with O(1) lookup by symbol and by
+    normalized company name, plus a trigram inverted index for fuzzy name
+    search. Exposes get() so it can stand in for the raw symbol dict wherever
+    a company_lookup is expected.
+    """
+
+    def __init__(self, companies: dict[str, dict]):
+        self.by_symbol = {}
+        self.by_name = {}
+
+        # Trigram -> ids of the names containing it, ids index self.names
+        self.names = []
+        self.name_trigram_counts = []
+        self.postings = {}
+
+        for symbol, entry in companies.items():
+            self.by_symbol[normalize_symbol(symbol)] = entry
+
+            name_key = normalize_company_name(entry.get('company_name'))
+            if not name_key:
+                continue
+
+            self.by_name.setdefault(name_key, entry)
+
+            name_id = len(self.names)
+            name_trigrams = trigrams(name_key)
+
+            self.names.append((normalize_symbol(symbol), entry))
+            self.name_trigram_counts.append(len(name_trigrams))
+
+            for trigram in name_trigrams:
+                self.postings.setdefault(trigram, []).append(name_id)
+
+    def __len__(self) -> int:
+        return len(self.by_symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        return normalize_symbol(symbol) in self.by_symbol
+
+    def get(self, symbol: str | None, default: dict | None = None) -> dict | None:
+        return self.by_symbol.get(normalize_symbol(symbol), default)
+
+    def find_by_name(self, company_name: str | None) -> dict | None:
+        return self.by_name.get(normalize_company_name(company_name))
+
+    def search(self, query: str | None, limit: int = 5, min_score: float = MIN_SEARCH_SCORE) -> list[dict]:
+        """
+        Rank companies by trigram similarity of their name to query.
+        Only names sharing a trigram with the query are ever scored.
+        """
+        query_key = normalize_company_name(query)
+
+        if not query_key:
+            return []
+
+        query_trigrams = trigrams(query_key)
+        shared = Counter()
+
+        for trigram in query_trigrams:
+            shared.update(self.postings.get(trigram, ()))
+
+        candidates = []
+        for name_id, shared_count in shared.items():
+            # Dice coefficient of the two trigram sets
+            score = 2 * shared_count / (len(query_trigrams) + self.name_trigram_counts[name_id])
+
+            if score >= min_score:
+                symbol, entry = self.names[name_id]
+                candidates.append({
+                    'symbol': symbol,
+                    'company_name': entry.get('company_name'),
+                    'score': round(score, 3)
+                })
+
+        candidates.sort(key=lambda candidate: (-candidate['score'], candidate['symbol']))
+
+        return candidates[:limit]
+
+
+@lru_cache(maxsize=None)
+def get_company_index(companies_path: str = COMPANIES_PATH) -> CompanyIndex:
+    """
+    Process wide index, companies.json is decoded once per process and path
+    """
+    with open(companies_path, 'r') as file:
+        companies = json.load(file)
+
+    return CompanyIndex(companies)
@@ -0,0 +1,97 @@
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+
+import os
+import requests
+
+
+# Point at a local stub with NEWS_API_BASE_URL=http://localhost:8000
+DEFAULT_BASE_URL = os.environ.get('NEWS_API_BASE_URL', 'https://sectors-news-endpoint.fly.dev')
+
+# (connect, read) seconds
+DEFAULT_TIMEOUT = (10, 60)
+# Article generation reads and summarizes the source page first
+GENERATE_TIMEOUT = (10, 180)
+
+# Connections kept alive to the API, one per concurrent request
+POOL_SIZE = 10
+
+
+class NewsApiClient:
+    """
+    Client for the sectors-news-endpoint API. One keep-alive session per
+    client, so repeated calls reuse the pooled connection instead of paying
+    for a new TCP and TLS handshake each time. Every call has a timeout.
+    Methods return the requests.Response, callers check status_code as before.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+        pool_size: int = POOL_SIZE
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers['Authorization'] = f'Bearer {api_key}'
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method: str, path: str, timeout: tuple[float, float] | None = None, **kwargs) -> requests.Response:
+        return self.session.request(method, f'{self.base_url}{path}', timeout=timeout or self.timeout, **kwargs)
+
+    # /url-article
+    def generate_article(self, source: str, timestamp: str) -> requests.Response:
+        return self.request(
+            'POST', '/url-article',
+            json={'source': source, 'timestamp': timestamp},
+            timeout=GENERATE_TIMEOUT
+        )
+
+    def post_article(self, article: dict) -> requests.Response:
+        return self.request('POST', '/url-article/post', json=article)
+
+    # /articles
+    def get_articles(self, article_id: int | None = None) -> requests.Response:
+        params = {'id': article_id} if article_id is not None else None
+        return self.request('GET', '/articles', params=params)
+
+    def update_article(self, article: dict) -> requests.Response:
+        return self.request('PATCH', '/articles', json=article)
+
+    def delete_articles(self, ids: list[int]) -> requests.Response:
+        return self.request('DELETE', '/articles', json={'id_list': ids})
+
+    # /insider-trading
+    def get_insider_trading(self) -> requests.Response:
+        return self.request('GET', '/insider-trading')
+
+    def create_insider_trading(self, filing: dict) -> requests.Response:
+        return self.request('POST', '/insider-trading', json=filing)
+
+    def update_insider_trading(self, filing: dict) -> requests.Response:
+        return self.request('PATCH', '/insider-trading', json=filing)
+
+    def delete_insider_trading(self, ids: list[int]) -> requests.Response:
+        return self.request('DELETE', '/insider-trading', json={'id_list': ids})
+
+    # /pdf/post
+    def post_pdf_filing(self, filing: dict) -> requests.Response:
+        return self.request('POST', '/pdf/post', json=filing)
+
+    # /sgx-insider-trading
+    def post_sgx_insider_trading(self, filings: list[dict]) -> requests.Response:
+        return self.request('POST', '/sgx-insider-trading', json=filings)
+
+
+@lru_cache(maxsize=None)
+def get_news_api(api_key: str, base_url: str = DEFAULT_BASE_URL) -> NewsApiClient:
+    """
+    Process wide client, every page and session shares its connection pool
+    """
+    return NewsApiClient(api_key, base_url)